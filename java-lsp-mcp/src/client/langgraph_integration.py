@@ -4,9 +4,10 @@ LangGraph Integration for Java Error Checker MCP Service
 Provides utilities and tools for consuming the MCP service from LangGraph agents.
 """
 
+import asyncio
 import json
 import httpx
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Set, Tuple
 from functools import wraps
 
 
@@ -15,6 +16,12 @@ class JavaErrorCheckerClient:
     Client for consuming Java Error Checker MCP service from LangGraph agents.
 
     This client provides a simple Python interface to the MCP service over HTTP/SSE.
+    A single HTTP connection pool is kept for the lifetime of the client; use it
+    as an async context manager or call aclose() when done.
+
+    Usage:
+        async with JavaErrorCheckerClient("http://localhost:8000") as client:
+            await client.create_session("my-project")
     """
 
     def __init__(self, base_url: str = "http://localhost:8000"):
@@ -26,6 +33,40 @@ class JavaErrorCheckerClient:
         """
         self.base_url = base_url.rstrip("/")
         self.session_id: Optional[str] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient bound to base_url
+        """
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.AsyncClient(
+                        base_url=self.base_url,
+                        timeout=30.0,
+                        limits=httpx.Limits(max_keepalive_connections=20)
+                    )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client. It is recreated if the client is used again."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def __aenter__(self):
+        """Enter context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit context and close the HTTP client."""
+        await self.aclose()
+        return False
 
     async def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -38,30 +79,105 @@ class JavaErrorCheckerClient:
         Returns:
             Tool response as dict
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.base_url}/sse",
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "tools/call",
-                    "params": {
-                        "name": tool_name,
-                        "arguments": arguments
-                    },
-                    "id": 1
-                }
-            )
-            response.raise_for_status()
-            result = response.json()
-
-            # Parse the result
-            if "result" in result and "content" in result["result"]:
-                content_text = result["result"]["content"][0]["text"]
-                return json.loads(content_text)
-            elif "error" in result:
-                raise Exception(f"MCP Error: {result['error']}")
-            else:
-                raise Exception(f"Unexpected response format: {result}")
+        client = await self._get_client()
+        response = await client.post(
+            "/sse",
+            json=self._tool_call_request(tool_name, arguments, 1)
+        )
+        response.raise_for_status()
+        return self._parse_tool_result(response.json())
+
+    async def _post_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Send several tool calls as one JSON-RPC batch request.
+
+        Args:
+            calls: (tool_name, arguments) pairs, executed by the server in order
+
+        Returns:
+            Raw JSON-RPC responses, in the same order as calls
+        """
+        client = await self._get_client()
+        response = await client.post(
+            "/sse",
+            json=[
+                self._tool_call_request(tool_name, arguments, request_id)
+                for request_id, (tool_name, arguments) in enumerate(calls)
+            ]
+        )
+        response.raise_for_status()
+
+        responses_by_id = {item.get("id"): item for item in response.json()}
+        return [
+            responses_by_id.get(request_id, {"error": f"No response for request {request_id}"})
+            for request_id in range(len(calls))
+        ]
+
+    async def _call_tools_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Call several MCP tools in a single HTTP round-trip.
+
+        Args:
+            calls: (tool_name, arguments) pairs, executed by the server in order
+
+        Returns:
+            Tool responses as dicts, in the same order as calls
+        """
+        return [self._parse_tool_result(result) for result in await self._post_batch(calls)]
+
+    def pipeline(self) -> "ToolCallPipeline":
+        """
+        Queue tool calls and send them as one batch when the block exits.
+
+        Usage:
+            async with client.pipeline() as pipe:
+                written = pipe.call("write_multiple_files", {"session_id": sid, "files": files})
+                checked = pipe.call("check_errors", {"session_id": sid})
+            errors = checked.result()
+
+        Returns:
+            ToolCallPipeline bound to this client
+        """
+        return ToolCallPipeline(self)
+
+    @staticmethod
+    def _tool_call_request(tool_name: str, arguments: Dict[str, Any], request_id: int) -> Dict[str, Any]:
+        """Build a JSON-RPC tools/call request object."""
+        return {
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "params": {
+                "name": tool_name,
+                "arguments": arguments
+            },
+            "id": request_id
+        }
+
+    @staticmethod
+    def _parse_tool_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract the tool response from a JSON-RPC response object.
+
+        Accepts both MCP content lists and the decoded JSON results returned
+        by the HTTP/SSE server.
+
+        Args:
+            result: JSON-RPC response object
+
+        Returns:
+            Tool response as dict
+        """
+        if "result" in result:
+            payload = result["result"]
+            # read_file results also have a "content" key, holding the source
+            # text; only a list is the MCP content shape
+            if isinstance(payload, dict) and isinstance(payload.get("content"), list):
+                return json.loads(payload["content"][0]["text"])
+            return payload
+        elif "error" in result:
+            raise Exception(f"MCP Error: {result['error']}")
+        else:
+            raise Exception(f"Unexpected response format: {result}")
 
     async def create_session(self, project_name: str = "langgraph-project") -> str:
         """
@@ -123,12 +239,17 @@ class JavaErrorCheckerClient:
             "files": files
         })
 
-    async def check_errors(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+    async def check_errors(
+        self,
+        session_id: Optional[str] = None,
+        incremental: bool = False
+    ) -> Dict[str, Any]:
         """
         Check for compilation errors.
 
         Args:
             session_id: Session ID (uses stored session_id if not provided)
+            incremental: Only recompile files changed since the last check
 
         Returns:
             Response dict with error_count and errors list
@@ -137,7 +258,7 @@ class JavaErrorCheckerClient:
         if not sid:
             raise ValueError("No session_id available. Call create_session() first.")
 
-        return await self._call_tool("check_errors", {"session_id": sid})
+        return await self._call_tool("check_errors", {"session_id": sid, "incremental": incremental})
 
     async def get_recommendations(
         self,
@@ -163,6 +284,32 @@ class JavaErrorCheckerClient:
             "error": error
         })
 
+    async def get_recommendations_batch(
+        self,
+        errors: List[Dict[str, Any]],
+        session_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get recommendations for several errors in a single HTTP round-trip.
+
+        Args:
+            errors: Error objects from check_errors
+            session_id: Session ID (uses stored session_id if not provided)
+
+        Returns:
+            Response dicts with recommendations, in the same order as errors
+        """
+        sid = session_id or self.session_id
+        if not sid:
+            raise ValueError("No session_id available. Call create_session() first.")
+        if not errors:
+            return []
+
+        return await self._call_tools_batch([
+            ("get_recommendations", {"session_id": sid, "error": error})
+            for error in errors
+        ])
+
     async def list_files(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         """
         List all Java files in the session.
@@ -253,6 +400,32 @@ class JavaErrorCheckerClient:
 
         return result
 
+    async def snapshot(
+        self,
+        include_errors: bool = False,
+        session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch session info, file list and optionally errors concurrently.
+
+        Args:
+            include_errors: Also run check_errors
+            session_id: Session ID (uses stored session_id if not provided)
+
+        Returns:
+            Dict with 'info', 'files' and, if requested, 'errors' responses
+        """
+        sid = session_id or self.session_id
+        if not sid:
+            raise ValueError("No session_id available. Call create_session() first.")
+
+        calls = [self.get_session_info(sid), self.list_files(sid)]
+        if include_errors:
+            calls.append(self.check_errors(sid))
+
+        results = await asyncio.gather(*calls)
+        return dict(zip(("info", "files", "errors"), results))
+
     async def health_check(self) -> Dict[str, Any]:
         """
         Check if the MCP server is healthy.
@@ -260,10 +433,176 @@ class JavaErrorCheckerClient:
         Returns:
             Health status dict
         """
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{self.base_url}/health")
-            response.raise_for_status()
-            return response.json()
+        client = await self._get_client()
+        response = await client.get("/health", timeout=5.0)
+        response.raise_for_status()
+        return response.json()
+
+    def bind(self, session_id: Optional[str] = None) -> "BoundSession":
+        """
+        Get a view of this client fixed to one session.
+
+        Args:
+            session_id: Session ID (uses stored session_id if not provided)
+
+        Returns:
+            BoundSession forwarding tool calls for the session
+        """
+        sid = session_id or self.session_id
+        if not sid:
+            raise ValueError("No session_id available. Call create_session() first.")
+        return BoundSession(self, sid)
+
+
+class BoundSession:
+    """
+    Tool calls for a single session, without per-call session_id lookups.
+
+    Usage:
+        session = client.bind(await client.create_session("my-project"))
+        await session.write_file("com/example/Main.java", source)
+        errors = await session.check_errors()
+    """
+
+    __slots__ = ("_client", "session_id")
+
+    def __init__(self, client: JavaErrorCheckerClient, session_id: str):
+        """
+        Initialize the bound session.
+
+        Args:
+            client: JavaErrorCheckerClient used to send tool calls
+            session_id: Session the calls are made for
+        """
+        self._client = client
+        self.session_id = session_id
+
+    async def write_file(self, file_path: str, content: str) -> Dict[str, Any]:
+        """Write a Java file to the session."""
+        return await self._client._call_tool("write_java_file", {
+            "session_id": self.session_id,
+            "file_path": file_path,
+            "content": content
+        })
+
+    async def write_multiple_files(self, files: List[Dict[str, str]]) -> Dict[str, Any]:
+        """Write multiple Java files in batch."""
+        return await self._client._call_tool("write_multiple_files", {
+            "session_id": self.session_id,
+            "files": files
+        })
+
+    async def check_errors(self, incremental: bool = False) -> Dict[str, Any]:
+        """Check for compilation errors."""
+        return await self._client._call_tool("check_errors", {
+            "session_id": self.session_id,
+            "incremental": incremental
+        })
+
+    async def get_recommendations(self, error: Dict[str, Any]) -> Dict[str, Any]:
+        """Get recommendations for fixing an error."""
+        return await self._client._call_tool("get_recommendations", {
+            "session_id": self.session_id,
+            "error": error
+        })
+
+    async def get_recommendations_batch(self, errors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Get recommendations for several errors in one round-trip."""
+        return await self._client.get_recommendations_batch(errors, self.session_id)
+
+    async def list_files(self) -> Dict[str, Any]:
+        """List all Java files in the session."""
+        return await self._client._call_tool("list_files", {"session_id": self.session_id})
+
+    async def read_file(self, file_path: str) -> Dict[str, Any]:
+        """Read a Java file from the session."""
+        return await self._client._call_tool("read_file", {
+            "session_id": self.session_id,
+            "file_path": file_path
+        })
+
+    async def refresh_session(self) -> Dict[str, Any]:
+        """Refresh session to extend timeout."""
+        return await self._client._call_tool("refresh_session", {"session_id": self.session_id})
+
+    async def get_session_info(self) -> Dict[str, Any]:
+        """Get session information."""
+        return await self._client._call_tool("get_session_info", {"session_id": self.session_id})
+
+    async def delete_session(self) -> Dict[str, Any]:
+        """Delete the session and cleanup."""
+        return await self._client.delete_session(self.session_id)
+
+
+class ToolCallPipeline:
+    """
+    Batches tool calls made inside an ``async with`` block into one request.
+
+    Each call() returns a future that is resolved with the tool response (or
+    its error) once the block exits and the batch has been sent.
+    """
+
+    def __init__(self, client: JavaErrorCheckerClient):
+        """
+        Initialize the pipeline.
+
+        Args:
+            client: JavaErrorCheckerClient used to send the batch
+        """
+        self.client = client
+        self._calls: List[Tuple[str, Dict[str, Any]]] = []
+        self._futures: List[asyncio.Future] = []
+
+    def call(self, tool_name: str, arguments: Dict[str, Any]) -> asyncio.Future:
+        """
+        Queue a tool call.
+
+        Args:
+            tool_name: Name of the tool to call
+            arguments: Tool arguments
+
+        Returns:
+            Future resolved with the tool response after the batch is sent
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._calls.append((tool_name, arguments))
+        self._futures.append(future)
+        return future
+
+    async def flush(self):
+        """Send all queued calls as one batch and resolve their futures."""
+        calls, futures = self._calls, self._futures
+        self._calls, self._futures = [], []
+        if not calls:
+            return
+
+        try:
+            responses = await self.client._post_batch(calls)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+        for future, response in zip(futures, responses):
+            try:
+                future.set_result(self.client._parse_tool_result(response))
+            except Exception as e:
+                future.set_exception(e)
+
+    async def __aenter__(self):
+        """Enter context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Send queued calls, or drop them if the block raised."""
+        if exc_type is not None:
+            for future in self._futures:
+                future.cancel()
+            self._calls, self._futures = [], []
+            return False
+
+        await self.flush()
+        return False
 
 
 # LangGraph Tool Wrappers
@@ -353,12 +692,19 @@ class JavaProjectSession:
     """
     Context manager for Java project sessions with automatic cleanup.
 
+    The session is deleted in a background task when the block exits, so the
+    caller doesn't wait for the round-trip. Use drain() to wait for pending
+    cleanups, e.g. before shutting down or in tests.
+
     Usage:
         async with JavaProjectSession(client, "my-project") as session:
             await session.write_multiple_files([...])
             errors = await session.check_errors()
     """
 
+    # Pending cleanup tasks, referenced here so they aren't garbage collected
+    _cleanup_tasks: Set[asyncio.Task] = set()
+
     def __init__(self, client: JavaErrorCheckerClient, project_name: str = "project"):
         """
         Initialize session context.
@@ -377,10 +723,22 @@ class JavaProjectSession:
         return self.client
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Exit context and cleanup session."""
-        if self.session_id:
+        """Exit context and schedule session cleanup in the background."""
+        task = asyncio.get_running_loop().create_task(self._cleanup(self.session_id))
+        self._cleanup_tasks.add(task)
+        task.add_done_callback(self._cleanup_tasks.discard)
+        return False
+
+    async def _cleanup(self, session_id: Optional[str]):
+        """Delete the session. The client's HTTP connections stay with its owner."""
+        if session_id:
             try:
-                await self.client.delete_session(self.session_id)
+                await self.client.delete_session(session_id)
             except Exception as e:
                 print(f"Error cleaning up session: {e}")
-        return False
+
+    @classmethod
+    async def drain(cls):
+        """Wait for all pending session cleanups to finish."""
+        if cls._cleanup_tasks:
+            await asyncio.gather(*cls._cleanup_tasks, return_exceptions=True)
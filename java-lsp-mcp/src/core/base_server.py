@@ -8,19 +8,39 @@ It implements the Server design pattern, separating transport-specific logic
 from reusable business logic.
 """
 
+import asyncio
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 
 from .session_manager import SessionManager
-from .jdtls_client import JDTLSClient
+from .jdtls_client import JDTLSClient, JDTLSPool
+from .config import JDTLS_POOL_SIZE
 from .error_recommendation_engine import ErrorRecommendationEngine
 
 logger = logging.getLogger(__name__)
 
+# Compact encoder for tool responses, created once rather than per call;
+# the text is carried as a str so non-ASCII need not be \u-escaped
+_RESPONSE_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def encode_response(response: Dict[str, Any]) -> List[TextContent]:
+    """Serialize a tool response as compact JSON in MCP TextContent.
+
+    Args:
+        response: Response dictionary from business logic
+
+    Returns:
+        List with a single TextContent holding the JSON text
+    """
+    return [TextContent(type="text", text=_RESPONSE_ENCODER.encode(response))]
+
 
 class ServerTransport(ABC):
     """Abstract base class for MCP server transports.
@@ -51,6 +71,196 @@ class ServerTransport(ABC):
         pass
 
 
+# MCP tool specifications, built once at import time
+_TOOLS: List[Tool] = [
+    Tool(
+        name="create_session",
+        description="Create a new Java project session with isolated workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_name": {
+                    "type": "string",
+                    "description": "Name of the Java project (optional)",
+                    "default": "default"
+                }
+            }
+        }
+    ),
+    Tool(
+        name="write_java_file",
+        description="Write a Java source file to the session workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID from create_session"
+                },
+                "file_path": {
+                    "type": "string",
+                    "description": "Relative path to Java file (e.g., 'com/example/Main.java')"
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Java source code content"
+                }
+            },
+            "required": ["session_id", "file_path", "content"]
+        }
+    ),
+    Tool(
+        name="write_multiple_files",
+        description="Write multiple Java source files to the session workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID from create_session"
+                },
+                "files": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "file_path": {"type": "string"},
+                            "content": {"type": "string"}
+                        },
+                        "required": ["file_path", "content"]
+                    },
+                    "description": "Array of {file_path, content} objects"
+                }
+            },
+            "required": ["session_id", "files"]
+        }
+    ),
+    Tool(
+        name="check_errors",
+        description="Check for compilation errors in the Java project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID from create_session"
+                },
+                "strict": {
+                    "type": "boolean",
+                    "description": "Also report lint warnings (slower, optional)",
+                    "default": False
+                },
+                "incremental": {
+                    "type": "boolean",
+                    "description": "Only recompile files changed since the last check (faster, "
+                                   "but may miss errors an edit causes in other files)",
+                    "default": False
+                },
+                "rebuild": {
+                    "type": "boolean",
+                    "description": "Discard incremental build state and rebuild every file "
+                                   "(slower, optional)",
+                    "default": False
+                }
+            },
+            "required": ["session_id"]
+        }
+    ),
+    Tool(
+        name="list_files",
+        description="List all Java files in the session workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID from create_session"
+                }
+            },
+            "required": ["session_id"]
+        }
+    ),
+    Tool(
+        name="read_file",
+        description="Read the content of a Java file from the workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID from create_session"
+                },
+                "file_path": {
+                    "type": "string",
+                    "description": "Relative path to Java file"
+                }
+            },
+            "required": ["session_id", "file_path"]
+        }
+    ),
+    Tool(
+        name="delete_session",
+        description="Delete a session and clean up its workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID to delete"
+                }
+            },
+            "required": ["session_id"]
+        }
+    ),
+    Tool(
+        name="get_recommendations",
+        description="Get recommendations for fixing a compilation error",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID"
+                },
+                "error": {
+                    "type": "object",
+                    "description": "Error object from check_errors"
+                }
+            },
+            "required": ["session_id", "error"]
+        }
+    ),
+    Tool(
+        name="refresh_session",
+        description="Refresh session timeout to prevent expiration",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID to refresh"
+                }
+            },
+            "required": ["session_id"]
+        }
+    ),
+    Tool(
+        name="get_session_info",
+        description="Get metadata about a session",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID"
+                }
+            },
+            "required": ["session_id"]
+        }
+    ),
+]
+
+
 class JavaErrorCheckerServer:
     """Core MCP Server for Java error checking.
 
@@ -65,6 +275,39 @@ class JavaErrorCheckerServer:
         self.jdtls_client = JDTLSClient()
         self.recommendation_engine = ErrorRecommendationEngine()
 
+        # Long-lived JDTLS processes, one per workspace, reused across checks
+        # and stopped when their session is deleted
+        self.lsp_clients: Dict[Path, JDTLSClient] = {}
+        self.jdtls_pool = JDTLSPool(
+            self.jdtls_client.jdtls_path,
+            self.jdtls_client.java_home,
+            size=JDTLS_POOL_SIZE
+        )
+        # Loop the processes were attached from, for stops requested off-loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.session_manager.register_on_session_deleted(self._on_session_deleted)
+
+        # Checks in progress, keyed by (workspace, strict, incremental, rebuild),
+        # so concurrent check_errors calls for a workspace share one compile
+        self._inflight_checks: Dict[Tuple[Path, bool, bool, bool], asyncio.Task] = {}
+        # Most recently started check per workspace; each check waits for the
+        # previous one so a workspace's compiler state is never used concurrently
+        self._last_checks: Dict[Path, asyncio.Task] = {}
+
+        # Tool name -> handler, built once rather than on every call
+        self._handlers = {
+            "create_session": self._handle_create_session,
+            "write_java_file": self._handle_write_java_file,
+            "write_multiple_files": self._handle_write_multiple_files,
+            "check_errors": self._handle_check_errors,
+            "list_files": self._handle_list_files,
+            "read_file": self._handle_read_file,
+            "delete_session": self._handle_delete_session,
+            "get_recommendations": self._handle_get_recommendations,
+            "refresh_session": self._handle_refresh_session,
+            "get_session_info": self._handle_get_session_info,
+        }
+
         logger.info("Java Error Checker MCP Server initialized")
 
     def _register_handlers(self):
@@ -80,217 +323,185 @@ class JavaErrorCheckerServer:
             """Route tool calls to appropriate handlers."""
             return await self._route_tool_call(name, arguments)
 
+    async def _get_jdtls_client(self, workspace_path: Path) -> JDTLSClient:
+        """Return the JDTLS client to use for a workspace.
+
+        A JDTLS process is taken from the warm pool the first time a workspace
+        is checked and reused afterwards. When JDTLS is not installed or fails
+        to start, the shared javac-based client is returned instead.
+        """
+        client = self.lsp_clients.get(workspace_path)
+        if client:
+            return client
+
+        if not self.jdtls_client.is_available:
+            return self.jdtls_client
+
+        try:
+            client = await self.jdtls_pool.acquire(workspace_path)
+        except Exception as e:
+            logger.warning(f"Could not start JDTLS for {workspace_path}, using javac: {e}")
+            return self.jdtls_client
+
+        # A concurrent check may have attached a process while we waited
+        existing = self.lsp_clients.setdefault(workspace_path, client)
+        if existing is not client:
+            await client.stop_server()
+        self._loop = asyncio.get_running_loop()
+        return existing
+
+    async def _stop_jdtls_client(self, workspace_path: Path) -> None:
+        """Stop the JDTLS process attached to a workspace, if any."""
+        client = self.lsp_clients.pop(workspace_path, None)
+        if client:
+            try:
+                await client.stop_server()
+            except Exception as e:
+                logger.error(f"Error stopping JDTLS for {workspace_path}: {e}")
+
+    def _on_session_deleted(self, session_id: str) -> None:
+        """Release the JDTLS process and client state of a deleted session's workspace.
+
+        Sessions may be deleted from worker threads, so the stop is scheduled
+        on the event loop the process was attached from.
+
+        Args:
+            session_id: The deleted session ID
+        """
+        workspace_path = self.session_manager.base_workspace_dir / session_id
+        self.jdtls_client.forget_workspace(workspace_path)
+        if workspace_path in self.lsp_clients and self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self._stop_jdtls_client(workspace_path), self._loop)
+
+    async def aclose(self) -> None:
+        """Shut down the warm JDTLS pool and every workspace's JDTLS process."""
+        await self.jdtls_pool.close()
+        await asyncio.gather(*(
+            self._stop_jdtls_client(workspace_path) for workspace_path in list(self.lsp_clients)
+        ))
+
+    async def _check_workspace(
+        self,
+        workspace_path: Path,
+        strict: bool = False,
+        incremental: bool = False,
+        rebuild: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Check a workspace for errors, joining an identical check in progress.
+
+        A new check starts once the workspace's previous check has finished.
+
+        Args:
+            workspace_path: Path to the session workspace
+            strict: Run javac with all lint checks
+            incremental: Only recompile files changed since the last check
+            rebuild: Rebuild every file, ignoring incremental build state
+
+        Returns:
+            List of compilation errors
+        """
+        key = (workspace_path, strict, incremental, rebuild)
+        task = self._inflight_checks.get(key)
+        if task is None:
+            previous = self._last_checks.get(workspace_path)
+            task = asyncio.ensure_future(
+                self._run_check(workspace_path, strict, incremental, rebuild, previous)
+            )
+            self._inflight_checks[key] = task
+            self._last_checks[workspace_path] = task
+            task.add_done_callback(lambda t: self._forget_check(key, t))
+
+        # Shielded so one caller going away doesn't cancel the others' check
+        return await asyncio.shield(task)
+
+    async def _run_check(
+        self,
+        workspace_path: Path,
+        strict: bool,
+        incremental: bool,
+        rebuild: bool = False,
+        previous: Optional[asyncio.Task] = None
+    ) -> List[Dict[str, Any]]:
+        """Run a compilation check with the workspace's JDTLS or javac client.
+
+        Args:
+            workspace_path: Path to the session workspace
+            strict: Run javac with all lint checks
+            incremental: Only recompile files changed since the last check
+            rebuild: Rebuild every file, ignoring incremental build state
+            previous: The workspace's previous check, waited for first
+
+        Returns:
+            List of compilation errors
+        """
+        if previous is not None:
+            # wait() rather than await, so the previous check's failure isn't ours
+            await asyncio.wait([previous])
+        jdtls_client = await self._get_jdtls_client(workspace_path)
+        return await jdtls_client.check_compilation_errors(
+            workspace_path,
+            strict=strict,
+            incremental=incremental,
+            rebuild=rebuild
+        )
+
+    def _forget_check(self, key: Tuple[Path, bool, bool, bool], task: asyncio.Task) -> None:
+        """Remove a finished check from the in-flight and per-workspace maps."""
+        if self._inflight_checks.get(key) is task:
+            del self._inflight_checks[key]
+        if self._last_checks.get(key[0]) is task:
+            del self._last_checks[key[0]]
+
+    def _invalidate_checks(self, session_id: str) -> None:
+        """Stop later check_errors calls joining checks started before a write.
+
+        The running checks still complete for the callers already awaiting
+        them; later checks start after them.
+        """
+        workspace_path = self.session_manager.get_workspace_path(session_id)
+        for key in [key for key in self._inflight_checks if key[0] == workspace_path]:
+            del self._inflight_checks[key]
+
     def _get_tools(self) -> list[Tool]:
         """Return list of available MCP tools.
 
-        This method defines all tool specifications in one place,
-        making it easier to maintain and extend.
+        The tool specifications are defined once in _TOOLS; a shallow copy
+        is returned so callers can't modify the shared list.
         """
-        return [
-            Tool(
-                name="create_session",
-                description="Create a new Java project session with isolated workspace",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_name": {
-                            "type": "string",
-                            "description": "Name of the Java project (optional)",
-                            "default": "default"
-                        }
-                    }
-                }
-            ),
-            Tool(
-                name="write_java_file",
-                description="Write a Java source file to the session workspace",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID from create_session"
-                        },
-                        "file_path": {
-                            "type": "string",
-                            "description": "Relative path to Java file (e.g., 'com/example/Main.java')"
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "Java source code content"
-                        }
-                    },
-                    "required": ["session_id", "file_path", "content"]
-                }
-            ),
-            Tool(
-                name="write_multiple_files",
-                description="Write multiple Java source files to the session workspace",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID from create_session"
-                        },
-                        "files": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "file_path": {"type": "string"},
-                                    "content": {"type": "string"}
-                                },
-                                "required": ["file_path", "content"]
-                            },
-                            "description": "Array of {file_path, content} objects"
-                        }
-                    },
-                    "required": ["session_id", "files"]
-                }
-            ),
-            Tool(
-                name="check_errors",
-                description="Check for compilation errors in the Java project",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID from create_session"
-                        }
-                    },
-                    "required": ["session_id"]
-                }
-            ),
-            Tool(
-                name="list_files",
-                description="List all Java files in the session workspace",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID from create_session"
-                        }
-                    },
-                    "required": ["session_id"]
-                }
-            ),
-            Tool(
-                name="read_file",
-                description="Read the content of a Java file from the workspace",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID from create_session"
-                        },
-                        "file_path": {
-                            "type": "string",
-                            "description": "Relative path to Java file"
-                        }
-                    },
-                    "required": ["session_id", "file_path"]
-                }
-            ),
-            Tool(
-                name="delete_session",
-                description="Delete a session and clean up its workspace",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID to delete"
-                        }
-                    },
-                    "required": ["session_id"]
-                }
-            ),
-            Tool(
-                name="get_recommendations",
-                description="Get recommendations for fixing a compilation error",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID"
-                        },
-                        "error": {
-                            "type": "object",
-                            "description": "Error object from check_errors"
-                        }
-                    },
-                    "required": ["session_id", "error"]
-                }
-            ),
-            Tool(
-                name="refresh_session",
-                description="Refresh session timeout to prevent expiration",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID to refresh"
-                        }
-                    },
-                    "required": ["session_id"]
-                }
-            ),
-            Tool(
-                name="get_session_info",
-                description="Get metadata about a session",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID"
-                        }
-                    },
-                    "required": ["session_id"]
-                }
-            ),
-        ]
+        return list(_TOOLS)
 
     async def _route_tool_call(self, name: str, arguments: Dict[str, Any]) -> list[TextContent]:
+        """Dispatch a tool call and format its result for the MCP protocol."""
+        return await self._format_response(await self._dispatch_tool_call(name, arguments))
+
+    async def _dispatch_tool_call(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Route tool calls to appropriate handler methods.
 
         This method implements the Command pattern, dispatching to specific
-        handlers based on tool name.
+        handlers based on tool name. Handlers return plain dicts so in-process
+        callers and JSON transports can use them without a serialize/parse
+        round-trip; _route_tool_call() wraps them for MCP.
         """
-        handlers = {
-            "create_session": self._handle_create_session,
-            "write_java_file": self._handle_write_java_file,
-            "write_multiple_files": self._handle_write_multiple_files,
-            "check_errors": self._handle_check_errors,
-            "list_files": self._handle_list_files,
-            "read_file": self._handle_read_file,
-            "delete_session": self._handle_delete_session,
-            "get_recommendations": self._handle_get_recommendations,
-            "refresh_session": self._handle_refresh_session,
-            "get_session_info": self._handle_get_session_info,
-        }
-
-        handler = handlers.get(name)
+        handler = self._handlers.get(name)
         if not handler:
-            return [TextContent(type="text", text=str({
+            return {
                 "status": "error",
                 "message": f"Unknown tool: {name}"
-            }))]
+            }
 
         return await handler(arguments)
 
     # Tool handler methods
-    async def _handle_create_session(self, arguments: Dict[str, Any]) -> list[TextContent]:
+    async def _handle_create_session(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle create_session tool call."""
         project_name = arguments.get("project_name", "default")
 
-        session_id = self.session_manager.create_session(project_name)
+        # Workspace directories are created in a worker thread
+        session_id = await asyncio.to_thread(self.session_manager.create_session, project_name)
+
+        # Warm up JDTLS processes while the client writes its sources
+        if self.jdtls_client.is_available:
+            self.jdtls_pool.ensure_started()
 
         response = {
             "status": "success",
@@ -299,9 +510,9 @@ class JavaErrorCheckerServer:
             "message": f"Session created successfully. Project: {project_name}"
         }
 
-        return await self._format_response(response)
+        return response
 
-    async def _handle_write_java_file(self, arguments: Dict[str, Any]) -> list[TextContent]:
+    async def _handle_write_java_file(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle write_java_file tool call."""
         session_id = arguments["session_id"]
         file_path = arguments["file_path"]
@@ -310,7 +521,9 @@ class JavaErrorCheckerServer:
         session = self.session_manager.get_session(session_id)
 
         if session:
-            self.session_manager.write_file(session_id, file_path, content)
+            # Disk I/O runs in a worker thread so it doesn't block the event loop
+            await asyncio.to_thread(self.session_manager.write_file, session_id, file_path, content)
+            self._invalidate_checks(session_id)
             response = {
                 "status": "success",
                 "session_id": session_id,
@@ -323,14 +536,16 @@ class JavaErrorCheckerServer:
                 "message": f"Failed to write file {file_path}. Session may not exist."
             }
 
-        return await self._format_response(response)
+        return response
 
-    async def _handle_write_multiple_files(self, arguments: Dict[str, Any]) -> list[TextContent]:
+    async def _handle_write_multiple_files(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle write_multiple_files tool call."""
         session_id = arguments["session_id"]
         files = arguments["files"]
 
-        result = self.session_manager.write_multiple_files(session_id, files)
+        # Disk I/O runs in a worker thread so it doesn't block the event loop
+        result = await asyncio.to_thread(self.session_manager.write_multiple_files, session_id, files)
+        self._invalidate_checks(session_id)
 
         if result.get("success"):
             response = {
@@ -349,9 +564,9 @@ class JavaErrorCheckerServer:
                 "message": result.get("error", "Failed to write files")
             }
 
-        return await self._format_response(response)
+        return response
 
-    async def _handle_check_errors(self, arguments: Dict[str, Any]) -> list[TextContent]:
+    async def _handle_check_errors(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle check_errors tool call."""
         session_id = arguments["session_id"]
 
@@ -361,9 +576,14 @@ class JavaErrorCheckerServer:
                 "status": "error",
                 "message": f"Session {session_id} not found"
             }
-            return await self._format_response(response)
+            return response
 
-        errors = await self.jdtls_client.check_compilation_errors(workspace_path)
+        errors = await self._check_workspace(
+            workspace_path,
+            strict=arguments.get("strict", False),
+            incremental=arguments.get("incremental", False),
+            rebuild=arguments.get("rebuild", False)
+        )
 
         response = {
             "status": "success",
@@ -377,9 +597,9 @@ class JavaErrorCheckerServer:
         else:
             response["message"] = f"Found {len(errors)} compilation error(s)"
 
-        return await self._format_response(response)
+        return response
 
-    async def _handle_list_files(self, arguments: Dict[str, Any]) -> list[TextContent]:
+    async def _handle_list_files(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle list_files tool call."""
         session_id = arguments["session_id"]
 
@@ -392,14 +612,14 @@ class JavaErrorCheckerServer:
             "files": files
         }
 
-        return await self._format_response(response)
+        return response
 
-    async def _handle_read_file(self, arguments: Dict[str, Any]) -> list[TextContent]:
+    async def _handle_read_file(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle read_file tool call."""
         session_id = arguments["session_id"]
         file_path = arguments["file_path"]
 
-        content = self.session_manager.read_file(session_id, file_path)
+        content = await asyncio.to_thread(self.session_manager.read_file, session_id, file_path)
 
         if content is not None:
             response = {
@@ -413,13 +633,15 @@ class JavaErrorCheckerServer:
                 "message": f"File {file_path} not found"
             }
 
-        return await self._format_response(response)
+        return response
 
-    async def _handle_delete_session(self, arguments: Dict[str, Any]) -> list[TextContent]:
+    async def _handle_delete_session(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle delete_session tool call."""
         session_id = arguments["session_id"]
 
-        success = self.session_manager.delete_session(session_id)
+        # Removing the workspace tree can take a while, so keep it off the loop;
+        # _on_session_deleted stops the workspace's JDTLS process
+        success = await asyncio.to_thread(self.session_manager.delete_session, session_id)
 
         if success:
             response = {
@@ -432,9 +654,9 @@ class JavaErrorCheckerServer:
                 "message": f"Session {session_id} not found"
             }
 
-        return await self._format_response(response)
+        return response
 
-    async def _handle_get_recommendations(self, arguments: Dict[str, Any]) -> list[TextContent]:
+    async def _handle_get_recommendations(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle get_recommendations tool call."""
         session_id = arguments["session_id"]
         error = arguments["error"]
@@ -448,9 +670,9 @@ class JavaErrorCheckerServer:
             "recommendations": recommendations
         }
 
-        return await self._format_response(response)
+        return response
 
-    async def _handle_refresh_session(self, arguments: Dict[str, Any]) -> list[TextContent]:
+    async def _handle_refresh_session(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle refresh_session tool call."""
         session_id = arguments["session_id"]
 
@@ -468,9 +690,9 @@ class JavaErrorCheckerServer:
                 "message": f"Session {session_id} not found"
             }
 
-        return await self._format_response(response)
+        return response
 
-    async def _handle_get_session_info(self, arguments: Dict[str, Any]) -> list[TextContent]:
+    async def _handle_get_session_info(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle get_session_info tool call."""
         session_id = arguments["session_id"]
 
@@ -487,12 +709,12 @@ class JavaErrorCheckerServer:
                 "message": f"Session {session_id} not found"
             }
 
-        return await self._format_response(response)
+        return response
 
     async def _format_response(self, response: Dict[str, Any]) -> list[TextContent]:
         """Format response for MCP protocol.
 
         This method can be overridden by transport-specific implementations
-        if needed, but by default converts to string representation.
+        if needed, but by default serializes the response as compact JSON.
         """
-        return [TextContent(type="text", text=str(response))]
+        return encode_response(response)
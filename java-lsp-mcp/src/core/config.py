@@ -18,9 +18,23 @@ SESSION_TIMEOUT = int(os.getenv("SESSION_TIMEOUT", "3600"))
 JDTLS_PATH = os.getenv("JDTLS_PATH", str(Path.home() / ".local/share/jdtls"))
 JDTLS_MEMORY = os.getenv("JDTLS_MEMORY", "1G")
 
+# Number of pre-initialized JDTLS processes kept warm for new sessions
+JDTLS_POOL_SIZE = int(os.getenv("JDTLS_POOL_SIZE", "2"))
+
+# Threads used to write the files of one write_multiple_files batch
+BATCH_WRITE_WORKERS = int(os.getenv("BATCH_WRITE_WORKERS", "8"))
+
 # Java configuration
 JAVA_HOME = os.getenv("JAVA_HOME", "")
 
+# Port of a running Nailgun server used to run javac in a warm JVM
+# (empty to spawn javac directly)
+NAILGUN_PORT = os.getenv("NAILGUN_PORT", "")
+
+# Dynamic CDS archive reused across javac runs to speed up JVM startup
+# (requires JDK 19+; empty to disable)
+JAVAC_CDS_ARCHIVE = os.getenv("JAVAC_CDS_ARCHIVE", "")
+
 # Logging configuration
 LOG_FILE = os.getenv("LOG_FILE", "/tmp/java-error-checker-mcp.log")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
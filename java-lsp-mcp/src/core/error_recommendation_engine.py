@@ -5,38 +5,134 @@ This module provides intelligent recommendations for fixing Java compilation err
 It implements the Strategy pattern to handle different error types.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+import inspect
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Recommendation templates are immutable, so every call returns the same tuple.
+_CANNOT_FIND_SYMBOL_RECS = (
+    "Check that the class, variable, or method name is spelled correctly",
+    "Ensure the required import statement is present",
+    "Verify that the variable is declared before use",
+)
+
+_SYNTAX_ERROR_RECS = (
+    "Check for missing or extra braces { }",
+    "Ensure all methods are inside a class",
+    "Verify that all blocks are properly closed",
+)
+
+_MISSING_SEMICOLON_RECS = (
+    "Add a semicolon at the end of the statement",
+    "Check for syntax errors in the line",
+)
+
+_TYPE_MISMATCH_RECS = (
+    "Check that the value type matches the variable type",
+    "Consider explicit type casting if appropriate",
+    "Verify that method return types match expected types",
+)
+
+_METHOD_SIGNATURE_RECS = (
+    "Check the number and types of arguments passed to the method",
+    "Verify the method signature matches the expected parameters",
+    "Ensure arguments are in the correct order",
+)
+
+_DUPLICATE_DECLARATION_RECS = (
+    "Remove or rename the duplicate declaration",
+    "Check for accidental duplicate imports",
+    "Verify variable names are unique in scope",
+)
+
+_PACKAGE_NOT_FOUND_RECS = (
+    "Verify the package name is spelled correctly",
+    "Check that the required library is in the classpath",
+    "Ensure the dependency is properly configured",
+)
+
+_UNREACHABLE_CODE_RECS = (
+    "Remove code after return, break, or continue statements",
+    "Check for unreachable code blocks",
+    "Verify control flow logic",
+)
+
+_DEFAULT_RECS = (
+    "Review the error message and consult Java documentation",
+    "Check the syntax and naming conventions",
+    "Verify all imports and dependencies are correct",
+)
+
+
+# can_handle() support for the lower_msg argument, per strategy class
+_LOWER_MSG_SUPPORT: Dict[type, bool] = {}
+
+
+def _accepts_lower_msg(strategy: "RecommendationStrategy") -> bool:
+    """Check whether a strategy's can_handle() takes the lower_msg argument.
+
+    Custom strategies written against the original can_handle(self, error)
+    signature are still supported; the result is cached per class.
+    """
+    cls = type(strategy)
+    accepts = _LOWER_MSG_SUPPORT.get(cls)
+    if accepts is None:
+        try:
+            params = inspect.signature(strategy.can_handle).parameters.values()
+        except (TypeError, ValueError):
+            params = ()
+        accepts = any(
+            p.name == "lower_msg" or p.kind is inspect.Parameter.VAR_KEYWORD
+            for p in params
+        )
+        _LOWER_MSG_SUPPORT[cls] = accepts
+    return accepts
+
 
 class RecommendationStrategy:
     """Base class for error-specific recommendation strategies.
 
     This implements the Strategy design pattern, allowing different
-    error types to have specialized recommendation logic.
+    error types to have specialized recommendation logic. Strategies hold
+    no per-instance state, so the built-in ones declare empty __slots__.
     """
 
-    def can_handle(self, error: Dict[str, Any]) -> bool:
+    __slots__ = ()
+
+    def can_handle(self, error: Dict[str, Any], lower_msg: Optional[str] = None) -> bool:
         """Check if this strategy can handle the given error.
 
+        Subclasses may implement either can_handle(self, error) or accept
+        the optional lower_msg as well; the engine only passes it to
+        strategies that take it.
+
         Args:
             error: Error dictionary with 'message' key
+            lower_msg: The error message already lowercased by the engine,
+                or None to lowercase it from error
 
         Returns:
             True if this strategy should handle the error
         """
         raise NotImplementedError
 
-    def get_recommendations(self, error: Dict[str, Any]) -> List[str]:
+    @staticmethod
+    def _lower_message(error: Dict[str, Any], lower_msg: Optional[str]) -> str:
+        """Return lower_msg, or the error's lowercased message if not given."""
+        if lower_msg is None:
+            return error.get("message", "").lower()
+        return lower_msg
+
+    def get_recommendations(self, error: Dict[str, Any]) -> Tuple[str, ...]:
         """Generate recommendations for the error.
 
         Args:
             error: Error dictionary
 
         Returns:
-            List of recommendation strings
+            Tuple of recommendation strings
         """
         raise NotImplementedError
 
@@ -44,120 +140,105 @@ class RecommendationStrategy:
 class CannotFindSymbolStrategy(RecommendationStrategy):
     """Strategy for 'cannot find symbol' errors."""
 
-    def can_handle(self, error: Dict[str, Any]) -> bool:
-        message = error.get("message", "").lower()
-        return "cannot find symbol" in message
+    __slots__ = ()
 
-    def get_recommendations(self, error: Dict[str, Any]) -> List[str]:
-        return [
-            "Check that the class, variable, or method name is spelled correctly",
-            "Ensure the required import statement is present",
-            "Verify that the variable is declared before use"
-        ]
+    def can_handle(self, error: Dict[str, Any], lower_msg: Optional[str] = None) -> bool:
+        lower_msg = self._lower_message(error, lower_msg)
+        return "cannot find symbol" in lower_msg
+
+    def get_recommendations(self, error: Dict[str, Any]) -> Tuple[str, ...]:
+        return _CANNOT_FIND_SYMBOL_RECS
 
 
 class SyntaxErrorStrategy(RecommendationStrategy):
     """Strategy for syntax errors like missing braces."""
 
-    def can_handle(self, error: Dict[str, Any]) -> bool:
-        message = error.get("message", "").lower()
-        return "class, interface, or enum expected" in message
+    __slots__ = ()
 
-    def get_recommendations(self, error: Dict[str, Any]) -> List[str]:
-        return [
-            "Check for missing or extra braces { }",
-            "Ensure all methods are inside a class",
-            "Verify that all blocks are properly closed"
-        ]
+    def can_handle(self, error: Dict[str, Any], lower_msg: Optional[str] = None) -> bool:
+        lower_msg = self._lower_message(error, lower_msg)
+        return "class, interface, or enum expected" in lower_msg
+
+    def get_recommendations(self, error: Dict[str, Any]) -> Tuple[str, ...]:
+        return _SYNTAX_ERROR_RECS
 
 
 class MissingSemicolonStrategy(RecommendationStrategy):
     """Strategy for missing semicolon errors."""
 
-    def can_handle(self, error: Dict[str, Any]) -> bool:
-        message = error.get("message", "").lower()
-        return "';' expected" in message
+    __slots__ = ()
 
-    def get_recommendations(self, error: Dict[str, Any]) -> List[str]:
-        return [
-            "Add a semicolon at the end of the statement",
-            "Check for syntax errors in the line"
-        ]
+    def can_handle(self, error: Dict[str, Any], lower_msg: Optional[str] = None) -> bool:
+        lower_msg = self._lower_message(error, lower_msg)
+        return "';' expected" in lower_msg
+
+    def get_recommendations(self, error: Dict[str, Any]) -> Tuple[str, ...]:
+        return _MISSING_SEMICOLON_RECS
 
 
 class TypeMismatchStrategy(RecommendationStrategy):
     """Strategy for type mismatch errors."""
 
-    def can_handle(self, error: Dict[str, Any]) -> bool:
-        message = error.get("message", "").lower()
-        return any(x in message for x in ["incompatible types", "type mismatch"])
+    __slots__ = ()
 
-    def get_recommendations(self, error: Dict[str, Any]) -> List[str]:
-        return [
-            "Check that the value type matches the variable type",
-            "Consider explicit type casting if appropriate",
-            "Verify that method return types match expected types"
-        ]
+    def can_handle(self, error: Dict[str, Any], lower_msg: Optional[str] = None) -> bool:
+        lower_msg = self._lower_message(error, lower_msg)
+        return "incompatible types" in lower_msg or "type mismatch" in lower_msg
+
+    def get_recommendations(self, error: Dict[str, Any]) -> Tuple[str, ...]:
+        return _TYPE_MISMATCH_RECS
 
 
 class MethodSignatureStrategy(RecommendationStrategy):
     """Strategy for method signature errors."""
 
-    def can_handle(self, error: Dict[str, Any]) -> bool:
-        message = error.get("message", "").lower()
-        return "method" in message and "cannot be applied" in message
+    __slots__ = ()
 
-    def get_recommendations(self, error: Dict[str, Any]) -> List[str]:
-        return [
-            "Check the number and types of arguments passed to the method",
-            "Verify the method signature matches the expected parameters",
-            "Ensure arguments are in the correct order"
-        ]
+    def can_handle(self, error: Dict[str, Any], lower_msg: Optional[str] = None) -> bool:
+        lower_msg = self._lower_message(error, lower_msg)
+        return "method" in lower_msg and "cannot be applied" in lower_msg
+
+    def get_recommendations(self, error: Dict[str, Any]) -> Tuple[str, ...]:
+        return _METHOD_SIGNATURE_RECS
 
 
 class DuplicateDeclarationStrategy(RecommendationStrategy):
     """Strategy for duplicate declaration errors."""
 
-    def can_handle(self, error: Dict[str, Any]) -> bool:
-        message = error.get("message", "").lower()
-        return "duplicate" in message
+    __slots__ = ()
 
-    def get_recommendations(self, error: Dict[str, Any]) -> List[str]:
-        return [
-            "Remove or rename the duplicate declaration",
-            "Check for accidental duplicate imports",
-            "Verify variable names are unique in scope"
-        ]
+    def can_handle(self, error: Dict[str, Any], lower_msg: Optional[str] = None) -> bool:
+        lower_msg = self._lower_message(error, lower_msg)
+        return "duplicate" in lower_msg
+
+    def get_recommendations(self, error: Dict[str, Any]) -> Tuple[str, ...]:
+        return _DUPLICATE_DECLARATION_RECS
 
 
 class PackageNotFoundStrategy(RecommendationStrategy):
     """Strategy for package/import not found errors."""
 
-    def can_handle(self, error: Dict[str, Any]) -> bool:
-        message = error.get("message", "").lower()
-        return "package" in message and "does not exist" in message
+    __slots__ = ()
 
-    def get_recommendations(self, error: Dict[str, Any]) -> List[str]:
-        return [
-            "Verify the package name is spelled correctly",
-            "Check that the required library is in the classpath",
-            "Ensure the dependency is properly configured"
-        ]
+    def can_handle(self, error: Dict[str, Any], lower_msg: Optional[str] = None) -> bool:
+        lower_msg = self._lower_message(error, lower_msg)
+        return "package" in lower_msg and "does not exist" in lower_msg
+
+    def get_recommendations(self, error: Dict[str, Any]) -> Tuple[str, ...]:
+        return _PACKAGE_NOT_FOUND_RECS
 
 
 class UnreachableCodeStrategy(RecommendationStrategy):
     """Strategy for unreachable code errors."""
 
-    def can_handle(self, error: Dict[str, Any]) -> bool:
-        message = error.get("message", "").lower()
-        return "unreachable statement" in message
+    __slots__ = ()
 
-    def get_recommendations(self, error: Dict[str, Any]) -> List[str]:
-        return [
-            "Remove code after return, break, or continue statements",
-            "Check for unreachable code blocks",
-            "Verify control flow logic"
-        ]
+    def can_handle(self, error: Dict[str, Any], lower_msg: Optional[str] = None) -> bool:
+        lower_msg = self._lower_message(error, lower_msg)
+        return "unreachable statement" in lower_msg
+
+    def get_recommendations(self, error: Dict[str, Any]) -> Tuple[str, ...]:
+        return _UNREACHABLE_CODE_RECS
 
 
 class ErrorRecommendationEngine:
@@ -189,18 +270,30 @@ class ErrorRecommendationEngine:
         self.strategies.insert(0, strategy)  # Check custom strategies first
         logger.info(f"Registered strategy: {strategy.__class__.__name__}")
 
-    def get_recommendations(self, error: Dict[str, Any]) -> List[str]:
+    def get_recommendations(self, error: Dict[str, Any]) -> Tuple[str, ...]:
         """Get recommendations for an error.
 
         Args:
             error: Error dictionary with 'message' key
 
         Returns:
-            List of recommendation strings
+            Tuple of recommendation strings
         """
-        # Find first matching strategy
+        lower_msg = error.get("message", "").lower()
+
+        # Find first matching strategy; a strategy that fails to match is
+        # skipped rather than failing the lookup
         for strategy in self.strategies:
-            if strategy.can_handle(error):
+            try:
+                if _accepts_lower_msg(strategy):
+                    matched = strategy.can_handle(error, lower_msg=lower_msg)
+                else:
+                    matched = strategy.can_handle(error)
+            except Exception as e:
+                logger.error(f"Error in strategy {strategy.__class__.__name__}: {e}")
+                continue
+
+            if matched:
                 try:
                     return strategy.get_recommendations(error)
                 except Exception as e:
@@ -210,10 +303,6 @@ class ErrorRecommendationEngine:
         # Default recommendations
         return self._default_recommendations(error)
 
-    def _default_recommendations(self, error: Dict[str, Any]) -> List[str]:
+    def _default_recommendations(self, error: Dict[str, Any]) -> Tuple[str, ...]:
         """Return default recommendations for unhandled errors."""
-        return [
-            "Review the error message and consult Java documentation",
-            "Check the syntax and naming conventions",
-            "Verify all imports and dependencies are correct"
-        ]
+        return _DEFAULT_RECS
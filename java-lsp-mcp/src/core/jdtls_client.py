@@ -5,15 +5,260 @@ Manages communication with the Eclipse JDT Language Server for Java compilation
 """
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
-import subprocess
+import os
+import re
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
+from urllib.parse import unquote, urlparse
+import shutil
 import tempfile
 
+from .config import JAVAC_CDS_ARCHIVE, NAILGUN_PORT
+
 logger = logging.getLogger(__name__)
 
+# Above this many source files, javac receives its file list via an @argfile
+ARGFILE_THRESHOLD = 500
+
+# Maximum number of per-file javac results kept in the compile cache
+COMPILE_CACHE_SIZE = 10000
+
+# Timeouts (seconds) for LSP requests sent to a running JDTLS process
+LSP_INITIALIZE_TIMEOUT = 120.0
+LSP_BUILD_TIMEOUT = 300.0
+LSP_DIAGNOSTICS_TIMEOUT = 30.0
+
+# Backoff (seconds) between failed attempts to warm up a pooled JDTLS process
+POOL_RETRY_DELAY = 1.0
+POOL_RETRY_MAX_DELAY = 60.0
+
+# LSP FileChangeType and DiagnosticSeverity values
+FILE_CREATED = 1
+FILE_CHANGED = 2
+FILE_DELETED = 3
+LSP_SEVERITIES = {1: "error", 2: "warning", 3: "info", 4: "hint"}
+LSP_SEVERITY_ERROR = 1
+
+# java/buildWorkspace results that mean JDTLS did not finish building
+BUILD_FAILED = 0
+BUILD_CANCELLED = 3
+
+# JVM options for directly spawned javac. With JAVAC_CDS_ARCHIVE set, JDK 19+
+# writes the classes loaded by the first run to a dynamic CDS archive and maps
+# it on later runs, cutting javac's startup time
+JAVAC_JVM_FLAGS: Tuple[str, ...] = (
+    (f"-J-XX:SharedArchiveFile={JAVAC_CDS_ARCHIVE}", "-J-XX:+AutoCreateSharedArchive")
+    if JAVAC_CDS_ARCHIVE else ()
+)
+
+# Exit status of the ng client when it cannot reach the Nailgun server
+NAILGUN_CONNECT_FAILED = 230
+
+# Compact encoder for outgoing LSP messages; non-ASCII text is sent as raw
+# UTF-8 rather than \u escapes since the body is encoded to bytes anyway
+_LSP_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+# javac diagnostic header ("File.java:12: error: message") and caret line.
+# Matched against raw stderr bytes; only the captured groups are decoded.
+_JAVAC_ERR_RE = re.compile(
+    rb'^(?P<file>.+?\.java):(?P<line>\d+):\s*(?P<sev>error|warning):\s*(?P<msg>.*)$'
+)
+_POINTER_RE = re.compile(rb'^(\s*)\^')
+
+# javac flags used when only errors matter: skip annotation processing,
+# class generation for implicitly loaded sources, debug info and warnings
+FAST_JAVAC_FLAGS = ("-proc:none", "-implicit:none", "-g:none", "-nowarn")
+
+# subprocess can only spawn children with posix_spawn() instead of
+# fork() + exec() when the executable is given as a path and close_fds is
+# off. Python descriptors are non-inheritable by default (PEP 446), so
+# leaving close_fds off does not leak them into javac or JDTLS.
+SPAWN_KWARGS = {"close_fds": False}
+
+# Common JDTLS installation paths, searched in order
+_COMMON_JDTLS_PATHS: Tuple[Path, ...] = (
+    Path.home() / ".local/share/jdtls",
+    Path("/usr/local/share/jdtls"),
+    Path("/opt/jdtls"),
+)
+
+# Build output and tooling directories at the workspace root that are never
+# scanned for sources. Deeper directories with these names (e.g. a package
+# called "build") are scanned as usual.
+EXCLUDED_DIRS = frozenset({"target", "build", "out", "node_modules"})
+
+
+def _iter_java_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield directory entries of all Java source files under a directory.
+
+    Walks iteratively with os.scandir, reusing the cached DirEntry type
+    information, and skips hidden directories and build output directly
+    under the root. Entries are yielded rather than paths so callers can
+    reuse their cached stat().
+
+    Args:
+        root: Directory to search
+
+    Yields:
+        DirEntry objects for .java files
+    """
+    pending = deque([(root, True)])
+    while pending:
+        directory, at_root = pending.popleft()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not (at_root and (name.startswith(".") or name in EXCLUDED_DIRS)):
+                            pending.append((entry.path, False))
+                    elif name.endswith(".java"):
+                        yield entry
+        except OSError as e:
+            logger.warning(f"Could not scan {directory}: {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def _locate_jdtls() -> Optional[Path]:
+    """Try to find a JDTLS installation. Cached for the process lifetime."""
+    for path in _COMMON_JDTLS_PATHS:
+        if path.exists():
+            return path
+
+    logger.warning("JDTLS not found in common paths")
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _locate_java_home() -> Optional[Path]:
+    """Try to find JAVA_HOME. Cached for the process lifetime."""
+    java_home = os.environ.get("JAVA_HOME")
+    if java_home:
+        return Path(java_home)
+
+    # Resolve symlinks on the java executable and go up to find JAVA_HOME
+    java_executable = shutil.which("java")
+    if java_executable:
+        return Path(java_executable).resolve().parent.parent
+
+    logger.warning("Could not find JAVA_HOME: java not found on PATH")
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _locate_javac() -> str:
+    """Resolve javac to an absolute path so it can be started with posix_spawn."""
+    return shutil.which("javac") or "javac"
+
+
+@functools.lru_cache(maxsize=1)
+def _locate_javac_command() -> Tuple[str, ...]:
+    """
+    Build the javac launcher, preferring a warm Nailgun server when configured.
+
+    With NAILGUN_PORT set and the ng client on PATH, javac runs inside the
+    Nailgun JVM, which must have been started with the JDK compiler available.
+    """
+    if NAILGUN_PORT:
+        ng = shutil.which("ng")
+        if ng:
+            return (ng, "--nailgun-port", NAILGUN_PORT, "com.sun.tools.javac.Main")
+        logger.warning("NAILGUN_PORT is set but the ng client was not found; using javac")
+    return _direct_javac_command()
+
+
+def _direct_javac_command() -> Tuple[str, ...]:
+    """Build the launcher for a directly spawned javac process."""
+    return (_locate_javac(), *JAVAC_JVM_FLAGS)
+
+
+@functools.lru_cache(maxsize=None)
+def _locate_launcher_jar(jdtls_path: Path) -> Optional[Path]:
+    """Find the launcher JAR of a JDTLS installation."""
+    plugins_dir = jdtls_path / "plugins"
+    if not plugins_dir.exists():
+        return None
+
+    # Look for org.eclipse.equinox.launcher_*.jar
+    launcher_jars = list(plugins_dir.glob("org.eclipse.equinox.launcher_*.jar"))
+    return launcher_jars[0] if launcher_jars else None
+
+
+@functools.lru_cache(maxsize=None)
+def _locate_config_dir(jdtls_path: Path) -> Optional[Path]:
+    """Find the platform configuration directory of a JDTLS installation."""
+    for name in ("config_linux", "config_mac", "config_win"):
+        config_dir = jdtls_path / name
+        if config_dir.exists():
+            return config_dir
+
+    return None
+
+
+class _JavacErrorParser:
+    """Incremental parser for javac diagnostics, fed one line at a time.
+
+    Each diagnostic header is followed by the offending source line and a
+    caret line marking the column.
+    """
+
+    def __init__(self, workspace_path: Path):
+        """
+        Initialize the parser.
+
+        Args:
+            workspace_path: Root workspace path, used to relativize file paths
+        """
+        self.workspace_path = workspace_path
+        self.errors: List[Dict[str, Any]] = []
+        self._expect: Optional[str] = None
+        self._ws_prefix = os.fsencode(str(workspace_path) + os.sep)
+
+    def feed(self, line: bytes):
+        """
+        Consume one line of raw javac output.
+
+        Args:
+            line: Output line, with or without its trailing newline
+        """
+        if self._expect == "code":
+            # Next line might contain the code snippet
+            self._expect = "pointer"
+            code_line = line.strip()
+            if code_line:
+                self.errors[-1]["code"] = code_line.decode('utf-8', 'replace')
+            return
+
+        if self._expect == "pointer":
+            # Next line might contain the error pointer (^)
+            self._expect = None
+            pointer = _POINTER_RE.match(line)
+            if pointer:
+                self.errors[-1]["column"] = len(pointer.group(1))
+                return
+
+        # javac error format: file.java:line: error: message
+        match = _JAVAC_ERR_RE.match(line.strip())
+        if not match:
+            return
+
+        self.errors.append({
+            # Make file path relative to the workspace when it lies inside it
+            "file": match.group("file").removeprefix(self._ws_prefix).decode('utf-8', 'replace'),
+            "line": int(match.group("line")),
+            "column": 0,
+            "severity": match.group("sev").decode('ascii'),
+            "message": match.group("msg").strip().decode('utf-8', 'replace')
+        })
+        self._expect = "code"
+
 
 class JDTLSClient:
     """Client for interacting with Eclipse JDT Language Server."""
@@ -28,52 +273,68 @@ class JDTLSClient:
         """
         self.jdtls_path = Path(jdtls_path) if jdtls_path else self._find_jdtls()
         self.java_home = Path(java_home) if java_home else self._find_java_home()
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
         self.message_id = 0
+        self.workspace_path: Optional[Path] = None
+
+        # LSP session state, populated once start_server() has launched JDTLS
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._diagnostics: Dict[str, List[Dict[str, Any]]] = {}
+        # Documents opened in JDTLS: uri -> (version, (st_mtime_ns, st_size)),
+        # with no stat info when the text must be resent on the next check
+        self._open_documents: Dict[str, Tuple[int, Optional[Tuple[int, int]]]] = {}
+        # Diagnostics awaited for sent document versions: uri -> (version, future)
+        self._awaited_diagnostics: Dict[str, Tuple[int, asyncio.Future]] = {}
+        self._owns_data_dir = False
+
+        # javac results per source file, keyed by (path, content digest, strict)
+        self._compile_cache: "OrderedDict[Tuple[str, bytes, bool], List[Dict[str, Any]]]" = OrderedDict()
+        # Content digests, keyed by (path, st_mtime_ns, st_size) so unchanged files aren't re-read
+        self._source_digests: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+        # Digests are computed on worker threads, possibly for several workspaces at once
+        self._source_digests_lock = Lock()
+        self._compiled_sources: Dict[Path, Tuple[bool, frozenset]] = {}
+
+    @property
+    def is_available(self) -> bool:
+        """Whether a JDTLS installation and Java runtime were found."""
+        return bool(
+            self.jdtls_path and self.jdtls_path.exists()
+            and self.java_home and self.java_home.exists()
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """Whether a JDTLS process is running for this client."""
+        return self.process is not None and self.process.returncode is None
 
     def _find_jdtls(self) -> Optional[Path]:
         """Try to find JDTLS installation."""
-        # Common installation paths
-        common_paths = [
-            Path.home() / ".local/share/jdtls",
-            Path("/usr/local/share/jdtls"),
-            Path("/opt/jdtls"),
-        ]
-
-        for path in common_paths:
-            if path.exists():
-                return path
-
-        logger.warning("JDTLS not found in common paths")
-        return None
+        return _locate_jdtls()
 
     def _find_java_home(self) -> Optional[Path]:
         """Try to find JAVA_HOME."""
-        import os
+        return _locate_java_home()
 
-        java_home = os.environ.get("JAVA_HOME")
-        if java_home:
-            return Path(java_home)
+    def _find_launcher_jar(self) -> Optional[Path]:
+        """Find the JDTLS launcher JAR."""
+        if not self.jdtls_path:
+            return None
+        return _locate_launcher_jar(self.jdtls_path)
 
-        # Try to find java executable
-        try:
-            result = subprocess.run(
-                ["which", "java"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            java_path = Path(result.stdout.strip())
-            # Resolve symlinks and go up to find JAVA_HOME
-            java_path = java_path.resolve()
-            return java_path.parent.parent
-        except Exception as e:
-            logger.warning(f"Could not find JAVA_HOME: {e}")
+    def _find_config_dir(self) -> Optional[Path]:
+        """Find the JDTLS configuration directory."""
+        if not self.jdtls_path:
             return None
+        return _locate_config_dir(self.jdtls_path)
 
     async def start_server(self, workspace_path: Path, data_dir: Optional[Path] = None):
         """
-        Start the JDTLS server for a workspace.
+        Start the JDTLS server for a workspace and perform the LSP handshake.
+
+        The process is kept alive so that later calls to check_compilation_errors
+        reuse JDTLS's incremental build state instead of spawning javac.
 
         Args:
             workspace_path: Path to the Java project workspace
@@ -86,6 +347,7 @@ class JDTLSClient:
             raise RuntimeError("JAVA_HOME not found. Please install Java and set JAVA_HOME.")
 
         # Use temp directory for data if not specified
+        self._owns_data_dir = data_dir is None
         if data_dir is None:
             data_dir = Path(tempfile.mkdtemp(prefix="jdtls-data-"))
 
@@ -120,62 +382,216 @@ class JDTLSClient:
         logger.info(f"Starting JDTLS with command: {' '.join(command)}")
         logger.info(f"Workspace: {workspace_path}")
 
-        # Note: In a real implementation, we would start the process and communicate via stdin/stdout
-        # For this implementation, we'll use the language server protocol
         self.workspace_path = workspace_path
         self.data_dir = data_dir
         self.command = command
 
-    def _find_launcher_jar(self) -> Optional[Path]:
-        """Find the JDTLS launcher JAR."""
-        if not self.jdtls_path:
-            return None
+        self.process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            **SPAWN_KWARGS
+        )
+        self._reader_task = asyncio.create_task(self._read_messages())
 
-        plugins_dir = self.jdtls_path / "plugins"
-        if not plugins_dir.exists():
-            return None
+        try:
+            await self._send_request(
+                "initialize",
+                {
+                    "processId": os.getpid(),
+                    "rootUri": workspace_path.as_uri(),
+                    "workspaceFolders": [
+                        {"uri": workspace_path.as_uri(), "name": workspace_path.name}
+                    ],
+                    "capabilities": {
+                        "textDocument": {"publishDiagnostics": {"versionSupport": True}},
+                        "workspace": {
+                            "didChangeWatchedFiles": {"dynamicRegistration": False},
+                            "workspaceFolders": True
+                        }
+                    }
+                },
+                timeout=LSP_INITIALIZE_TIMEOUT
+            )
+            await self._send_notification("initialized", {})
+        except Exception:
+            await self.stop_server()
+            raise
 
-        # Look for org.eclipse.equinox.launcher_*.jar
-        launcher_jars = list(plugins_dir.glob("org.eclipse.equinox.launcher_*.jar"))
-        return launcher_jars[0] if launcher_jars else None
+        logger.info(f"JDTLS initialized for workspace {workspace_path}")
 
-    def _find_config_dir(self) -> Optional[Path]:
-        """Find the JDTLS configuration directory."""
-        if not self.jdtls_path:
-            return None
+    async def switch_workspace(self, workspace_path: Path):
+        """
+        Point a running JDTLS process at a different workspace folder.
 
-        config_dir = self.jdtls_path / "config_linux"
-        if config_dir.exists():
-            return config_dir
+        Args:
+            workspace_path: Path to the new Java project workspace
+        """
+        previous = self.workspace_path
+        await self._send_notification("workspace/didChangeWorkspaceFolders", {
+            "event": {
+                "added": [{"uri": workspace_path.as_uri(), "name": workspace_path.name}],
+                "removed": [{"uri": previous.as_uri(), "name": previous.name}] if previous else []
+            }
+        })
+        self.workspace_path = workspace_path
+        self._diagnostics.clear()
+        self._open_documents.clear()
+        self._awaited_diagnostics.clear()
+        logger.info(f"JDTLS switched from {previous} to workspace {workspace_path}")
 
-        config_dir = self.jdtls_path / "config_mac"
-        if config_dir.exists():
-            return config_dir
+    async def _send_message(self, message: Dict[str, Any]):
+        """
+        Write a JSON-RPC message to JDTLS using LSP Content-Length framing.
 
-        config_dir = self.jdtls_path / "config_win"
-        if config_dir.exists():
-            return config_dir
+        Args:
+            message: JSON-RPC message
+        """
+        body = _LSP_ENCODER.encode(message).encode("utf-8")
+        header = f"Content-Length: {len(body)}\r\n\r\n".encode("ascii")
+        self.process.stdin.write(header + body)
+        await self.process.stdin.drain()
 
-        return None
+    async def _send_notification(self, method: str, params: Any):
+        """
+        Send a JSON-RPC notification to JDTLS.
+
+        Args:
+            method: LSP method name
+            params: Notification parameters
+        """
+        await self._send_message({"jsonrpc": "2.0", "method": method, "params": params})
+
+    async def _send_request(self, method: str, params: Any, timeout: float) -> Any:
+        """
+        Send a JSON-RPC request to JDTLS and wait for the matching response.
+
+        Args:
+            method: LSP method name
+            params: Request parameters
+            timeout: Seconds to wait for the response
+
+        Returns:
+            The response's result field
+        """
+        self.message_id += 1
+        request_id = self.message_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        try:
+            await self._send_message({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params
+            })
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(request_id, None)
 
-    async def check_compilation_errors(self, workspace_path: Path) -> List[Dict[str, Any]]:
+    async def _read_messages(self):
+        """Read framed JSON-RPC messages from JDTLS until its stdout closes."""
+        reader = self.process.stdout
+        try:
+            while True:
+                content_length = 0
+                while True:
+                    header = await reader.readline()
+                    if not header:
+                        return
+                    header = header.strip()
+                    if not header:
+                        break
+                    name, _, value = header.decode("ascii").partition(":")
+                    if name.strip().lower() == "content-length":
+                        content_length = int(value.strip())
+
+                # json.loads decodes the UTF-8 body bytes directly
+                body = await reader.readexactly(content_length)
+                await self._handle_message(json.loads(body))
+        except asyncio.IncompleteReadError:
+            pass
+        except Exception as e:
+            logger.error(f"Error reading from JDTLS: {e}")
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(RuntimeError("JDTLS connection closed"))
+
+    async def _handle_message(self, message: Dict[str, Any]):
+        """
+        Dispatch a message received from JDTLS.
+
+        Args:
+            message: Decoded JSON-RPC message
+        """
+        method = message.get("method")
+
+        if method is None:
+            # Response to one of our requests
+            future = self._pending.get(message.get("id"))
+            if future and not future.done():
+                if "error" in message:
+                    future.set_exception(RuntimeError(f"JDTLS error: {message['error']}"))
+                else:
+                    future.set_result(message.get("result"))
+        elif method == "textDocument/publishDiagnostics":
+            params = message.get("params", {})
+            uri = params.get("uri", "")
+            self._diagnostics[uri] = params.get("diagnostics", [])
+
+            # Diagnostics without a version were still published after the send
+            awaited = self._awaited_diagnostics.get(uri)
+            version = params.get("version")
+            if awaited and (version is None or version >= awaited[0]):
+                del self._awaited_diagnostics[uri]
+                if not awaited[1].done():
+                    awaited[1].set_result(None)
+        elif "id" in message:
+            # Server-to-client request; JDTLS blocks until it gets an answer
+            result = None
+            if method == "workspace/configuration":
+                result = [None] * len(message.get("params", {}).get("items", []))
+            await self._send_message({"jsonrpc": "2.0", "id": message["id"], "result": result})
+
+    async def check_compilation_errors(
+        self,
+        workspace_path: Path,
+        strict: bool = False,
+        incremental: bool = False,
+        rebuild: bool = False
+    ) -> List[Dict[str, Any]]:
         """
-        Check for compilation errors in the workspace using javac.
+        Check for compilation errors in the workspace.
 
-        This is a simplified implementation that uses javac directly instead of
-        running a full JDTLS server. For production use, you would want to
-        implement full LSP communication with JDTLS.
+        If start_server() has launched JDTLS for this workspace, the running
+        language server is asked to rebuild and its diagnostics are returned.
+        Otherwise, or if the LSP check fails or JDTLS does not complete the
+        build, javac is run directly.
 
         Args:
             workspace_path: Path to the Java project workspace
+            strict: Run javac with all lint checks, annotation processing and
+                debug info instead of the faster errors-only configuration
+            incremental: Only recompile files changed since the last check and
+                reuse cached results for the rest. Faster, but errors that an
+                edit causes in unchanged files are not reported
+            rebuild: Discard JDTLS's incremental build state and cached javac
+                results and build every file from scratch
 
         Returns:
             List of compilation errors/warnings
         """
-        errors = []
+        use_lsp = self.is_running and self.workspace_path == workspace_path
 
-        # Find all Java files
-        java_files = list(workspace_path.rglob("*.java"))
+        # Walking the workspace and reading or hashing sources is blocking
+        # disk I/O, so it runs in a worker thread rather than on the event loop
+        entries, prepared = await asyncio.to_thread(
+            self._prepare_sources, workspace_path, use_lsp
+        )
+        java_files = [Path(entry.path) for entry in entries]
 
         if not java_files:
             logger.info("No Java files found in workspace")
@@ -183,168 +599,642 @@ class JDTLSClient:
 
         logger.info(f"Found {len(java_files)} Java files")
 
-        # Create a temporary directory for compilation output
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_output = Path(temp_dir)
+        if use_lsp:
+            try:
+                return await self._check_with_lsp(workspace_path, prepared, strict, rebuild)
+            except Exception as e:
+                logger.warning(f"JDTLS check failed, falling back to javac: {e}")
+            cache_keys = await asyncio.to_thread(
+                lambda: [self._compile_cache_key(entry) for entry in entries]
+            )
+        else:
+            cache_keys = prepared
+        cached = None if rebuild else self._get_cached_results(workspace_path, cache_keys, strict)
+        if cached is not None:
+            logger.info("No Java files changed since last check, using cached results")
+            return cached
+
+        compile_files = java_files
+        reused_errors: List[Dict[str, Any]] = []
+        reused_files = set()
+        if incremental and not rebuild and workspace_path in self._compiled_sources:
+            ws_prefix = str(workspace_path) + os.sep
+            compile_files = []
+            for java_file, key in zip(java_files, cache_keys):
+                file_errors = self._compile_cache.get((*key, strict))
+                if file_errors is None:
+                    compile_files.append(java_file)
+                else:
+                    reused_errors.extend(file_errors)
+                    reused_files.add(str(java_file).removeprefix(ws_prefix))
+            logger.info(f"Incremental check: recompiling {len(compile_files)} changed file(s)")
+
+        errors: List[Dict[str, Any]] = []
+        if compile_files:
+            # Create a temporary directory for compilation output
+            with tempfile.TemporaryDirectory() as temp_dir:
+                temp_output = Path(temp_dir)
+
+                # Compile every file in a single javac run so the JVM startup cost
+                # is paid once per check instead of once per file. Sources that
+                # are not recompiled are still resolved through the source path.
+                errors = await self._compile_files(compile_files, workspace_path, temp_output, strict)
+
+        # javac also reports errors in unchanged sources it resolves through
+        # the classpath; those files' cached results are used instead, so
+        # they aren't reported twice
+        errors = [error for error in errors if error["file"] not in reused_files]
+        errors.extend(reused_errors)
+        self._store_compile_results(workspace_path, java_files, cache_keys, errors, strict)
+        return errors
+
+    def _prepare_sources(self, workspace_path: Path, use_lsp: bool) -> Tuple[List[os.DirEntry], list]:
+        """Find a workspace's Java files and read what the check needs from them.
 
-            # Try to compile all Java files
-            for java_file in java_files:
-                try:
-                    result = await self._compile_file(java_file, workspace_path, temp_output)
-                    if result:
-                        errors.extend(result)
-                except Exception as e:
-                    logger.error(f"Error compiling {java_file}: {e}")
-                    errors.append({
-                        "file": str(java_file.relative_to(workspace_path)),
-                        "line": 0,
-                        "column": 0,
-                        "severity": "error",
-                        "message": f"Compilation failed: {str(e)}"
-                    })
+        Runs in a worker thread. For a JDTLS check the text of sources that
+        changed since they were last sent is read; otherwise the compile cache
+        keys of all sources are computed.
+
+        Args:
+            workspace_path: Root workspace path
+            use_lsp: Whether the check will go to the running JDTLS process
+
+        Returns:
+            Tuple of the Java files' directory entries and either their
+            documents for _check_with_lsp or their compile cache keys
+        """
+        entries = list(_iter_java_files(str(workspace_path)))
+        if use_lsp:
+            return entries, [self._read_document(entry) for entry in entries]
+        return entries, [self._compile_cache_key(entry) for entry in entries]
+
+    def _read_document(self, entry: os.DirEntry) -> Tuple[str, Tuple[int, int], Optional[str]]:
+        """Read a source file for JDTLS if it changed since it was last sent.
+
+        Args:
+            entry: Directory entry of the Java file
+
+        Returns:
+            Tuple of the file's URI, its (st_mtime_ns, st_size) and its text,
+            or None for the text when JDTLS already has the current version
+        """
+        uri = Path(entry.path).as_uri()
+        stat = entry.stat()
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+
+        opened = self._open_documents.get(uri)
+        if opened is not None and opened[1] == stat_key:
+            return uri, stat_key, None
+
+        with open(entry.path, encoding="utf-8", errors="replace") as f:
+            return uri, stat_key, f.read()
+
+    def _compile_cache_key(self, java_file: Union[Path, os.DirEntry]) -> Tuple[str, bytes]:
+        """Build the compile cache key for a source file from its content digest.
+
+        Keying on content means a file rewritten with identical source (as
+        agents often do) still hits the cache. The file is only read when its
+        stat info changed, so validating an unchanged file costs one stat()
+        call; DirEntry objects from the workspace walk cache that result, so
+        the walk and the cache check share it.
+        """
+        path = os.fspath(java_file)
+        stat = java_file.stat()
+        stat_key = (path, stat.st_mtime_ns, stat.st_size)
+
+        with self._source_digests_lock:
+            digest = self._source_digests.get(stat_key)
+            if digest is not None:
+                self._source_digests.move_to_end(stat_key)
+                return (path, digest)
+
+        with open(path, "rb") as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).digest()
 
+        with self._source_digests_lock:
+            self._source_digests[stat_key] = digest
+            while len(self._source_digests) > COMPILE_CACHE_SIZE:
+                self._source_digests.popitem(last=False)
+
+        return (path, digest)
+
+    def _get_cached_results(
+        self,
+        workspace_path: Path,
+        cache_keys: List[Tuple[str, bytes]],
+        strict: bool = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return cached javac results if no source file was added, removed or modified.
+
+        Errors in one file can be caused by edits to another, so cached results
+        are only reused when every file in the workspace is unchanged.
+
+        Args:
+            workspace_path: Root workspace path
+            cache_keys: Compile cache keys of the current source files
+            strict: Whether results of a strict compile are wanted
+
+        Returns:
+            Cached list of errors, or None if javac must be run
+        """
+        sources = frozenset(key[0] for key in cache_keys)
+        if self._compiled_sources.get(workspace_path) != (strict, sources):
+            return None
+
+        errors = []
+        for key in cache_keys:
+            file_errors = self._compile_cache.get((*key, strict))
+            if file_errors is None:
+                return None
+            self._compile_cache.move_to_end((*key, strict))
+            errors.extend(file_errors)
         return errors
 
-    async def _compile_file(
+    def _store_compile_results(
         self,
-        java_file: Path,
         workspace_path: Path,
-        output_dir: Path
+        java_files: List[Path],
+        cache_keys: List[Tuple[str, bytes]],
+        errors: List[Dict[str, Any]],
+        strict: bool = False
+    ):
+        """
+        Record javac results per source file in the compile cache.
+
+        Args:
+            workspace_path: Root workspace path
+            java_files: Paths to the compiled Java files
+            cache_keys: Compile cache keys of java_files
+            errors: Errors reported by javac
+            strict: Whether javac ran in strict mode
+        """
+        ws_prefix = str(workspace_path) + os.sep
+        errors_by_file = {
+            str(java_file).removeprefix(ws_prefix): [] for java_file in java_files
+        }
+        for error in errors:
+            file_errors = errors_by_file.get(error["file"])
+            if file_errors is None:
+                # Not attributable to a source file (e.g. javac missing); don't cache
+                self._compiled_sources.pop(workspace_path, None)
+                return
+            file_errors.append(error)
+
+        for key, file_errors in zip(cache_keys, errors_by_file.values()):
+            self._compile_cache[(*key, strict)] = file_errors
+            self._compile_cache.move_to_end((*key, strict))
+        while len(self._compile_cache) > COMPILE_CACHE_SIZE:
+            self._compile_cache.popitem(last=False)
+
+        self._compiled_sources[workspace_path] = (strict, frozenset(key[0] for key in cache_keys))
+
+    async def _check_with_lsp(
+        self,
+        workspace_path: Path,
+        documents: List[Tuple[str, Tuple[int, int], Optional[str]]],
+        strict: bool = False,
+        rebuild: bool = False
     ) -> List[Dict[str, Any]]:
         """
-        Compile a single Java file and extract errors.
+        Collect diagnostics from the running JDTLS process.
+
+        Opens new sources in JDTLS, sends the text of changed ones and closes
+        deleted ones, then waits for an incremental workspace build to finish
+        and for diagnostics of every sent document version, which JDTLS may
+        publish after the build reply, before reading them.
 
         Args:
-            java_file: Path to the Java file
             workspace_path: Root workspace path
-            output_dir: Directory for compiled output
+            documents: (uri, stat info, text) of the Java files currently in
+                the workspace, as read by _read_document
+            strict: Report warnings as well as errors
+            rebuild: Force JDTLS to rebuild the workspace from scratch
 
         Returns:
             List of compilation errors
+
+        Raises:
+            RuntimeError: If JDTLS fails or cancels the build, or does not
+                publish diagnostics for the sent documents in time
         """
-        errors = []
+        current_files = set()
+        changes = []
+        awaited: Dict[str, asyncio.Future] = {}
+        for uri, stat_key, text in documents:
+            current_files.add(uri)
+            if text is None:
+                continue
+
+            opened = self._open_documents.get(uri)
+            if opened is None:
+                version = 1
+                await self._send_notification("textDocument/didOpen", {
+                    "textDocument": {"uri": uri, "languageId": "java", "version": version, "text": text}
+                })
+                changes.append({"uri": uri, "type": FILE_CREATED})
+            else:
+                version = opened[0] + 1
+                await self._send_notification("textDocument/didChange", {
+                    "textDocument": {"uri": uri, "version": version},
+                    "contentChanges": [{"text": text}]
+                })
+                changes.append({"uri": uri, "type": FILE_CHANGED})
+            self._open_documents[uri] = (version, stat_key)
+
+            future = asyncio.get_running_loop().create_future()
+            self._awaited_diagnostics[uri] = (version, future)
+            awaited[uri] = future
+
+        for uri in set(self._open_documents) - current_files:
+            await self._send_notification("textDocument/didClose", {"textDocument": {"uri": uri}})
+            changes.append({"uri": uri, "type": FILE_DELETED})
+            del self._open_documents[uri]
+            self._diagnostics.pop(uri, None)
 
+        try:
+            if changes:
+                await self._send_notification("workspace/didChangeWatchedFiles", {"changes": changes})
+            status = await self._send_request(
+                "java/buildWorkspace", rebuild, timeout=LSP_BUILD_TIMEOUT
+            )
+            if status in (BUILD_FAILED, BUILD_CANCELLED):
+                raise RuntimeError(f"JDTLS build did not complete (status {status})")
+
+            if awaited:
+                _, not_published = await asyncio.wait(
+                    awaited.values(), timeout=LSP_DIAGNOSTICS_TIMEOUT
+                )
+                if not_published:
+                    raise RuntimeError(
+                        f"JDTLS did not publish diagnostics for {len(not_published)} document(s)"
+                    )
+        except BaseException:
+            # Documents whose diagnostics never arrived are resent next check
+            for uri, future in awaited.items():
+                if not future.done():
+                    self._awaited_diagnostics.pop(uri, None)
+                    self._open_documents[uri] = (self._open_documents[uri][0], None)
+            raise
+
+        return list(self._iter_lsp_errors(workspace_path, current_files, strict))
+
+    def _iter_lsp_errors(
+        self,
+        workspace_path: Path,
+        current_files: set,
+        strict: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield published diagnostics of current source files as error dicts.
+
+        Args:
+            workspace_path: Root workspace path
+            current_files: URIs of the Java files currently in the workspace
+            strict: Include warnings and hints; otherwise only errors are
+                yielded, matching javac run with FAST_JAVAC_FLAGS
+
+        Yields:
+            Compilation errors in the check_compilation_errors format
+        """
+        ws_prefix = str(workspace_path) + os.sep
+        for uri, diagnostics in self._diagnostics.items():
+            if uri not in current_files:
+                continue
+
+            file_path = unquote(urlparse(uri).path).removeprefix(ws_prefix)
+
+            for diagnostic in diagnostics:
+                severity = diagnostic.get("severity", LSP_SEVERITY_ERROR)
+                if not strict and severity != LSP_SEVERITY_ERROR:
+                    continue
+                start = diagnostic.get("range", {}).get("start", {})
+                yield {
+                    "file": file_path,
+                    "line": start.get("line", 0) + 1,
+                    "column": start.get("character", 0),
+                    "severity": LSP_SEVERITIES.get(severity, "error"),
+                    "message": diagnostic.get("message", "")
+                }
+
+    async def _compile_files(
+        self,
+        java_files: List[Path],
+        workspace_path: Path,
+        output_dir: Path,
+        strict: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Compile a batch of Java files with one javac invocation and extract errors.
+
+        Large batches are passed through a javac @argfile to stay under the
+        OS command-line length limit.
+
+        Args:
+            java_files: Paths to the Java files
+            workspace_path: Root workspace path
+            output_dir: Directory for compiled output
+            strict: Enable all lint checks instead of FAST_JAVAC_FLAGS
+
+        Returns:
+            List of compilation errors
+        """
         # Build classpath (include src/main/java)
         src_dir = workspace_path / "src" / "main" / "java"
         classpath = str(src_dir)
 
+        if len(java_files) > ARGFILE_THRESHOLD:
+            argfile = output_dir / "sources.txt"
+            argfile.write_text(
+                "\n".join(self._quote_argfile_entry(str(f)) for f in java_files),
+                encoding="utf-8"
+            )
+            sources = [f"@{argfile}"]
+        else:
+            sources = [str(f) for f in java_files]
+
         # Run javac
-        command = [
-            "javac",
+        javac_args = [
             "-d", str(output_dir),
             "-cp", classpath,
-            "-Xlint:all",
-            str(java_file)
+            *(("-Xlint:all",) if strict else FAST_JAVAC_FLAGS),
+            *sources
         ]
 
         try:
-            process = await asyncio.create_subprocess_exec(
-                *command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+            launcher = _locate_javac_command()
+            returncode, parsed_errors = await self._run_javac(
+                [*launcher, *javac_args], workspace_path
             )
 
-            stdout, stderr = await process.communicate()
+            if returncode == NAILGUN_CONNECT_FAILED and launcher != _direct_javac_command():
+                logger.warning("Nailgun server unreachable, falling back to javac")
+                returncode, parsed_errors = await self._run_javac(
+                    [*_direct_javac_command(), *javac_args], workspace_path
+                )
 
-            if process.returncode != 0:
-                # Parse compilation errors from stderr
-                error_output = stderr.decode('utf-8')
-                parsed_errors = self._parse_javac_errors(error_output, workspace_path)
-                errors.extend(parsed_errors)
-            else:
-                logger.info(f"Successfully compiled {java_file.name}")
+            if returncode != 0:
+                return parsed_errors
+            logger.info(f"Successfully compiled {len(java_files)} Java files")
+            return []
 
         except FileNotFoundError:
             logger.error("javac not found. Please install Java JDK.")
-            errors.append({
-                "file": str(java_file.relative_to(workspace_path)),
+            return [{
+                "file": "",
                 "line": 0,
                 "column": 0,
                 "severity": "error",
                 "message": "javac compiler not found. Please install Java JDK."
-            })
+            }]
         except Exception as e:
             logger.error(f"Error running javac: {e}")
-            errors.append({
-                "file": str(java_file.relative_to(workspace_path)),
+            return [{
+                "file": "",
                 "line": 0,
                 "column": 0,
                 "severity": "error",
                 "message": f"Compilation error: {str(e)}"
-            })
+            }]
 
-        return errors
+    async def _run_javac(
+        self,
+        command: List[str],
+        workspace_path: Path
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Run one javac command and parse its diagnostics.
+
+        Args:
+            command: Launcher followed by javac arguments
+            workspace_path: Root workspace path
+
+        Returns:
+            Tuple of the exit status and the parsed errors
+        """
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **SPAWN_KWARGS
+        )
 
-    def _parse_javac_errors(self, error_output: str, workspace_path: Path) -> List[Dict[str, Any]]:
+        try:
+            # Parse compilation errors from stderr while javac is still running;
+            # stdout is drained concurrently so neither pipe can fill up
+            _, parsed_errors = await asyncio.gather(
+                process.stdout.read(),
+                self._parse_javac_stream(process.stderr, workspace_path)
+            )
+            await process.wait()
+        except BaseException:
+            # Don't leave javac running if the check is cancelled or fails
+            if process.returncode is None:
+                process.kill()
+            raise
+        return process.returncode, parsed_errors
+
+    @staticmethod
+    def _quote_argfile_entry(path: str) -> str:
+        """Quote a path for use in a javac @argfile."""
+        escaped = path.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+
+    def _parse_javac_errors(self, error_output: bytes, workspace_path: Path) -> List[Dict[str, Any]]:
         """
         Parse javac error output.
 
         Args:
-            error_output: javac stderr output
+            error_output: Raw javac stderr output
             workspace_path: Root workspace path
 
         Returns:
             List of parsed errors
         """
-        errors = []
-        lines = error_output.split('\n')
+        parser = _JavacErrorParser(workspace_path)
+        for line in error_output.split(b'\n'):
+            parser.feed(line)
+        return parser.errors
+
+    async def _parse_javac_stream(
+        self,
+        stream: asyncio.StreamReader,
+        workspace_path: Path
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse javac error output line by line as it is produced.
 
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        Args:
+            stream: javac stderr stream
+            workspace_path: Root workspace path
 
-            # javac error format: file.java:line: error: message
-            if '.java:' in line and (':' in line):
-                try:
-                    parts = line.split(':', 3)
-                    if len(parts) >= 4:
-                        file_path = parts[0].strip()
-                        line_num = int(parts[1].strip())
-                        severity = parts[2].strip()
-                        message = parts[3].strip()
-
-                        # Try to make file path relative
-                        try:
-                            rel_path = Path(file_path).relative_to(workspace_path)
-                            file_path = str(rel_path)
-                        except:
-                            pass
-
-                        errors.append({
-                            "file": file_path,
-                            "line": line_num,
-                            "column": 0,
-                            "severity": severity.lower() if severity in ["error", "warning"] else "error",
-                            "message": message
-                        })
-
-                        # Next line might contain the code snippet
-                        i += 1
-                        if i < len(lines):
-                            code_line = lines[i].strip()
-                            if code_line:
-                                errors[-1]["code"] = code_line
-
-                        # Next line might contain the error pointer (^)
-                        i += 1
-                        if i < len(lines) and '^' in lines[i]:
-                            pointer_line = lines[i]
-                            column = pointer_line.index('^')
-                            errors[-1]["column"] = column
-
-                except (ValueError, IndexError) as e:
-                    logger.debug(f"Could not parse error line: {line} - {e}")
-
-            i += 1
+        Returns:
+            List of parsed errors
+        """
+        parser = _JavacErrorParser(workspace_path)
+        async for line in stream:
+            parser.feed(line)
+        return parser.errors
 
-        return errors
+    def forget_workspace(self, workspace_path: Path) -> None:
+        """Drop the per-workspace state kept for a workspace that was deleted.
+
+        Per-file compile results are left to age out of the bounded compile cache.
+
+        Args:
+            workspace_path: Root path of the deleted workspace
+        """
+        self._compiled_sources.pop(workspace_path, None)
+
+        uri_prefix = workspace_path.as_uri() + "/"
+        for documents in (self._open_documents, self._diagnostics, self._awaited_diagnostics):
+            for uri in [uri for uri in documents if uri.startswith(uri_prefix)]:
+                del documents[uri]
 
     async def stop_server(self):
         """Stop the JDTLS server."""
         if self.process:
-            self.process.terminate()
-            try:
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.process.kill()
+            if self.process.returncode is None:
+                try:
+                    await self._send_request("shutdown", None, timeout=5)
+                    await self._send_notification("exit", None)
+                    await asyncio.wait_for(self.process.wait(), timeout=5)
+                except Exception:
+                    self.process.kill()
+                    await self.process.wait()
             self.process = None
+
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+
+        if self._owns_data_dir and getattr(self, "data_dir", None):
+            shutil.rmtree(self.data_dir, ignore_errors=True)
+            self._owns_data_dir = False
+
+        self._diagnostics.clear()
+        self._open_documents.clear()
+        self._awaited_diagnostics.clear()
+
+
+class JDTLSPool:
+    """Pool of pre-initialized JDTLS processes waiting on scratch workspaces.
+
+    Starting JDTLS and completing the LSP handshake takes seconds, so a few
+    processes are kept warm in the background and handed out when a
+    workspace first needs one. The pool refills itself after each hand-out,
+    backing off between attempts when processes fail to start.
+    """
+
+    def __init__(
+        self,
+        jdtls_path: Optional[Path],
+        java_home: Optional[Path],
+        size: int = 2,
+        retry_delay: float = POOL_RETRY_DELAY
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            jdtls_path: Path to JDTLS installation
+            java_home: JAVA_HOME path
+            size: Number of warm processes to keep ready
+            retry_delay: Initial delay before retrying a failed warm-up; doubled
+                after each consecutive failure up to POOL_RETRY_MAX_DELAY
+        """
+        self.jdtls_path = jdtls_path
+        self.java_home = java_home
+        self.size = size
+        self.retry_delay = retry_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._fill_task: Optional[asyncio.Task] = None
+
+    def _new_client(self) -> JDTLSClient:
+        """Create an unstarted client sharing the pool's installation paths."""
+        return JDTLSClient(jdtls_path=self.jdtls_path, java_home=self.java_home)
+
+    def ensure_started(self):
+        """Start refilling the pool in the background if it is not already."""
+        if self.size <= 0:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.size)
+        if self._fill_task is None or self._fill_task.done():
+            self._fill_task = asyncio.create_task(self._fill())
+
+    async def _fill(self):
+        """Top the queue up with initialized clients.
+
+        Returns once the queue is full; acquire() restarts it after each
+        hand-out, so no process is started without a free slot.
+        """
+        delay = self.retry_delay
+        while not self._queue.full():
+            client = self._new_client()
+            scratch_dir = Path(tempfile.mkdtemp(prefix="jdtls-scratch-"))
+            try:
+                await client.start_server(scratch_dir)
+            except asyncio.CancelledError:
+                await client.stop_server()
+                shutil.rmtree(scratch_dir, ignore_errors=True)
+                raise
+            except Exception as e:
+                logger.warning(f"Could not warm up JDTLS process, retrying in {delay:.1f}s: {e}")
+                shutil.rmtree(scratch_dir, ignore_errors=True)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, POOL_RETRY_MAX_DELAY)
+                continue
+
+            delay = self.retry_delay
+            self._queue.put_nowait(client)
+
+    async def acquire(self, workspace_path: Path) -> JDTLSClient:
+        """
+        Get a running client attached to a workspace.
+
+        A warm client is used when one is ready; otherwise a new process is
+        started for the workspace.
+
+        Args:
+            workspace_path: Path to the Java project workspace
+
+        Returns:
+            Running JDTLSClient for the workspace
+        """
+        client = None
+        if self._queue is not None:
+            try:
+                client = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+
+        if client is not None and client.is_running:
+            scratch_dir = client.workspace_path
+            await client.switch_workspace(workspace_path)
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+        else:
+            if client is not None:
+                await client.stop_server()
+            client = self._new_client()
+            await client.start_server(workspace_path)
+
+        self.ensure_started()
+        return client
+
+    async def close(self):
+        """Stop the background refill and shut down all warm processes."""
+        if self._fill_task:
+            fill_task, self._fill_task = self._fill_task, None
+            fill_task.cancel()
+            try:
+                await fill_task
+            except asyncio.CancelledError:
+                pass
+
+        while self._queue is not None and not self._queue.empty():
+            client = self._queue.get_nowait()
+            scratch_dir = client.workspace_path
+            await client.stop_server()
+            if scratch_dir:
+                shutil.rmtree(scratch_dir, ignore_errors=True)
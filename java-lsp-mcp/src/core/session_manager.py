@@ -16,12 +16,28 @@ import uuid
 import time
 import logging
 from pathlib import Path
-from typing import Dict, Optional, List, Callable
+from typing import Dict, Optional, List, Callable, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from threading import Lock
 
+from .config import BATCH_WRITE_WORKERS
+
 logger = logging.getLogger(__name__)
 
+# Directories of a new session workspace, parents before children
+_PROJECT_SKELETON = (
+    "src",
+    os.path.join("src", "main"),
+    os.path.join("src", "main", "java"),
+    os.path.join("src", "test"),
+    os.path.join("src", "test", "java"),
+)
+
+# Deleted workspaces are renamed to this prefix and removed in the background
+_TRASH_PREFIX = ".trash-"
+_trash_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="workspace-trash")
+
 
 @dataclass
 class Session:
@@ -61,12 +77,16 @@ class PathResolutionStrategy:
 
 
 class JavaMainPathStrategy(PathResolutionStrategy):
-    """Strategy for main source files (src/main/java/)."""
+    """Strategy for main source files (src/main/java/).
+
+    Paths are built with a single joinpath() call rather than chained '/'
+    operators, which would create an intermediate Path per component.
+    """
 
     def resolve_path(self, workspace_path: Path, file_path: str) -> Path:
         if file_path.startswith("src/"):
             return workspace_path / file_path
-        return workspace_path / "src" / "main" / "java" / file_path
+        return workspace_path.joinpath("src", "main", "java", file_path)
 
 
 class JavaTestPathStrategy(PathResolutionStrategy):
@@ -77,8 +97,8 @@ class JavaTestPathStrategy(PathResolutionStrategy):
             return workspace_path / file_path
         # If starts with "test/", put in src/test/java
         if file_path.startswith("test/"):
-            return workspace_path / "src" / "test" / "java" / file_path[5:]
-        return workspace_path / "src" / "test" / "java" / file_path
+            return workspace_path.joinpath("src", "test", "java", file_path[5:])
+        return workspace_path.joinpath("src", "test", "java", file_path)
 
 
 class SessionRepository:
@@ -114,6 +134,21 @@ class SessionRepository:
         with self._lock:
             return self._sessions.get(session_id)
 
+    def touch(self, session_id: str) -> Optional[Session]:
+        """Retrieve a session and mark it as accessed under a single lock.
+
+        Args:
+            session_id: Session ID to retrieve
+
+        Returns:
+            Session object or None if not found
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session:
+                session.last_accessed = time.time()
+            return session
+
     def update(self, session: Session) -> bool:
         """Update an existing session.
 
@@ -182,9 +217,16 @@ class SessionManager:
         self.repository = SessionRepository()
         self.path_strategy = JavaMainPathStrategy()
 
-        # Observer callbacks for session events
-        self._on_session_created: List[Callable] = []
-        self._on_session_deleted: List[Callable] = []
+        # Java files per session (relative paths), kept in step with writes so
+        # list_files() doesn't walk the workspace on every call
+        self._files: Dict[str, Set[str]] = {}
+        self._files_lock = Lock()
+
+        # Observer callbacks for session events. Registration replaces the
+        # tuple rather than mutating it, so notifications running on worker
+        # threads iterate a stable snapshot
+        self._on_session_created: Tuple[Callable, ...] = ()
+        self._on_session_deleted: Tuple[Callable, ...] = ()
 
         self._ensure_base_directory()
         logger.info(f"SessionManager initialized with base dir: {base_workspace_dir}")
@@ -206,9 +248,18 @@ class SessionManager:
         return cls._instance
 
     def _ensure_base_directory(self) -> None:
-        """Ensure the base workspace directory exists."""
+        """Ensure the base workspace directory exists.
+
+        Workspaces left in the trash by a previous process are queued for
+        removal.
+        """
         self.base_workspace_dir.mkdir(parents=True, exist_ok=True)
 
+        with os.scandir(self.base_workspace_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(_TRASH_PREFIX) and entry.is_dir(follow_symlinks=False):
+                    _trash_executor.submit(shutil.rmtree, entry.path, True)
+
     def set_path_strategy(self, strategy: PathResolutionStrategy) -> None:
         """Set the path resolution strategy.
 
@@ -224,7 +275,7 @@ class SessionManager:
         Args:
             callback: Function to call when session is created
         """
-        self._on_session_created.append(callback)
+        self._on_session_created += (callback,)
 
     def register_on_session_deleted(self, callback: Callable) -> None:
         """Register a callback for when sessions are deleted.
@@ -232,7 +283,7 @@ class SessionManager:
         Args:
             callback: Function to call when session is deleted
         """
-        self._on_session_deleted.append(callback)
+        self._on_session_deleted += (callback,)
 
     def _notify_session_created(self, session: Session) -> None:
         """Notify observers that a session was created.
@@ -271,11 +322,10 @@ class SessionManager:
         workspace_path = self.base_workspace_dir / session_id
         workspace_path.mkdir(parents=True, exist_ok=True)
 
-        # Create standard Java project structure
-        src_main_java = workspace_path / "src" / "main" / "java"
-        src_test_java = workspace_path / "src" / "test" / "java"
-        src_main_java.mkdir(parents=True, exist_ok=True)
-        src_test_java.mkdir(parents=True, exist_ok=True)
+        # Create standard Java project structure top-down, so each directory
+        # takes one mkdir instead of parents=True retrying from the leaf
+        for directory in _PROJECT_SKELETON:
+            os.mkdir(workspace_path / directory)
 
         current_time = time.time()
         session = Session(
@@ -287,6 +337,8 @@ class SessionManager:
         )
 
         self.repository.create(session)
+        with self._files_lock:
+            self._files[session_id] = set()
         self._notify_session_created(session)
         logger.info(f"Created session {session_id} for project {project_name}")
 
@@ -301,11 +353,7 @@ class SessionManager:
         Returns:
             Session object or None if not found
         """
-        session = self.repository.get(session_id)
-        if session:
-            session.last_accessed = time.time()
-            self.repository.update(session)
-        return session
+        return self.repository.touch(session_id)
 
     def delete_session(self, session_id: str) -> bool:
         """Delete a session and clean up its workspace.
@@ -323,13 +371,15 @@ class SessionManager:
         # Clean up workspace directory
         try:
             if session.workspace_path.exists():
-                shutil.rmtree(session.workspace_path)
+                self._remove_workspace(session.workspace_path)
                 logger.info(f"Deleted workspace for session {session_id}")
         except Exception as e:
             logger.error(f"Error deleting workspace for session {session_id}: {e}")
 
         # Remove from repository
         self.repository.delete(session_id)
+        with self._files_lock:
+            self._files.pop(session_id, None)
         self._notify_session_deleted(session_id)
         return True
 
@@ -357,6 +407,7 @@ class SessionManager:
 
         try:
             full_path.write_text(content, encoding='utf-8')
+            self._track_file(session, full_path)
             logger.info(f"Wrote file {file_path} to session {session_id}")
             return True
         except Exception as e:
@@ -386,6 +437,12 @@ class SessionManager:
         written = 0
         failed = 0
         failed_files = []
+        created_dirs = set()
+
+        # Entries for the same path are grouped so they are still written in
+        # request order; distinct paths are written concurrently below
+        pending: Dict[Path, List[Tuple[str, str]]] = {}
+        resolve_path = self.path_strategy.resolve_path
 
         for file_info in files:
             file_path = file_info.get("file_path")
@@ -399,23 +456,47 @@ class SessionManager:
                 })
                 continue
 
-            # Use strategy to resolve path
-            full_path = self.path_strategy.resolve_path(session.workspace_path, file_path)
-
-            # Ensure parent directories exist
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-
-            try:
-                full_path.write_text(content, encoding='utf-8')
-                written += 1
-                logger.info(f"Wrote file {file_path} to session {session_id}")
-            except Exception as e:
-                failed += 1
-                failed_files.append({
-                    "file_path": file_path,
-                    "error": str(e)
-                })
-                logger.error(f"Error writing file {file_path}: {e}")
+            # Use strategy to resolve path, normalized so spellings of the same
+            # file (e.g. "a/../A.java") are grouped together
+            full_path = Path(os.path.normpath(resolve_path(session.workspace_path, file_path)))
+
+            # Ensure parent directories exist, once per directory in the batch
+            if full_path.parent not in created_dirs:
+                full_path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(full_path.parent)
+
+            pending.setdefault(full_path, []).append((file_path, content))
+
+        def write_entries(full_path: Path) -> List[Tuple[str, Optional[Exception]]]:
+            outcomes = []
+            for file_path, content in pending[full_path]:
+                try:
+                    full_path.write_text(content, encoding='utf-8')
+                    self._track_file(session, full_path)
+                    outcomes.append((file_path, None))
+                except Exception as e:
+                    outcomes.append((file_path, e))
+            return outcomes
+
+        workers = min(BATCH_WRITE_WORKERS, len(pending))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(write_entries, pending))
+        else:
+            results = [write_entries(full_path) for full_path in pending]
+
+        for outcomes in results:
+            for file_path, error in outcomes:
+                if error is None:
+                    written += 1
+                    logger.info(f"Wrote file {file_path} to session {session_id}")
+                else:
+                    failed += 1
+                    failed_files.append({
+                        "file_path": file_path,
+                        "error": str(error)
+                    })
+                    logger.error(f"Error writing file {file_path}: {error}")
 
         result = {
             "success": True,
@@ -466,11 +547,58 @@ class SessionManager:
         if not session:
             return []
 
-        java_files = []
-        for java_file in session.workspace_path.rglob("*.java"):
-            relative_path = java_file.relative_to(session.workspace_path)
-            java_files.append(str(relative_path))
+        with self._files_lock:
+            files = self._files.get(session_id)
+            if files is None:
+                files = self._files[session_id] = self._scan_java_files(session.workspace_path)
+            return sorted(files)
+
+    def _track_file(self, session: Session, full_path: Path) -> None:
+        """Record a written file in the session's file listing.
+
+        The path is normalized first, so it matches the entry a rescan of
+        the workspace would produce.
+
+        Args:
+            session: Session the file was written to
+            full_path: Absolute path of the written file, as resolved by the
+                path strategy
+        """
+        if full_path.suffix != ".java":
+            return
+        try:
+            relative_path = str(Path(os.path.normpath(full_path)).relative_to(session.workspace_path))
+        except ValueError:
+            return
+
+        with self._files_lock:
+            files = self._files.get(session.session_id)
+            if files is not None:
+                files.add(relative_path)
+
+    @staticmethod
+    def _scan_java_files(workspace_path: Path) -> Set[str]:
+        """Find all Java files in a workspace with a single os.scandir walk.
+
+        Args:
+            workspace_path: Workspace root
 
+        Returns:
+            Set of relative file paths
+        """
+        java_files = set()
+        pending = [(str(workspace_path), "")]
+        while pending:
+            directory, prefix = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append((entry.path, prefix + entry.name + os.sep))
+                        elif entry.name.endswith(".java") and entry.is_file(follow_symlinks=False):
+                            java_files.add(prefix + entry.name)
+            except OSError:
+                continue
         return java_files
 
     def get_workspace_path(self, session_id: str) -> Optional[Path]:
@@ -496,15 +624,31 @@ class SessionManager:
         Returns:
             True if session was refreshed, False if not found
         """
-        session = self.repository.get(session_id)
-        if not session:
+        if not self.repository.touch(session_id):
             return False
 
-        session.last_accessed = time.time()
-        self.repository.update(session)
         logger.info(f"Refreshed session {session_id}")
         return True
 
+    @staticmethod
+    def _remove_workspace(workspace_path: Path) -> None:
+        """Remove a workspace without waiting for its tree to be deleted.
+
+        The directory is renamed aside in a single syscall and the recursive
+        delete runs on a background thread. If the rename fails, the
+        workspace is removed inline.
+
+        Args:
+            workspace_path: Workspace directory to remove
+        """
+        trash_path = workspace_path.with_name(_TRASH_PREFIX + workspace_path.name)
+        try:
+            os.rename(workspace_path, trash_path)
+        except OSError:
+            shutil.rmtree(workspace_path)
+            return
+        _trash_executor.submit(shutil.rmtree, trash_path, True)
+
     def get_session_info(self, session_id: str) -> Optional[Dict[str, any]]:
         """Get detailed information about a session.
 
@@ -8,7 +8,6 @@ Implements the Strategy pattern to allow pluggable transport mechanisms.
 """
 
 import asyncio
-import json
 import logging
 from typing import Any, Dict, List
 from abc import abstractmethod
@@ -18,7 +17,7 @@ from mcp.server import NotificationOptions
 from mcp.server.models import InitializationOptions
 from mcp.types import TextContent
 
-from .base_server import ServerTransport, JavaErrorCheckerServer
+from .base_server import ServerTransport, JavaErrorCheckerServer, encode_response
 
 logger = logging.getLogger(__name__)
 
@@ -31,15 +30,15 @@ class StdioServerTransport(ServerTransport):
     """
 
     async def send_response(self, response: Dict[str, Any]) -> List[TextContent]:
-        """Convert response dict to string format for stdio transport.
+        """Convert response dict to JSON-formatted TextContent for stdio transport.
 
         Args:
             response: Response dictionary from business logic
 
         Returns:
-            List with single TextContent containing string representation
+            List with single TextContent containing compact JSON
         """
-        return [TextContent(type="text", text=str(response))]
+        return encode_response(response)
 
     async def run(self, server: JavaErrorCheckerServer) -> None:
         """Run the stdio transport server.
@@ -82,8 +81,7 @@ class JsonResponseTransport(ServerTransport):
         Returns:
             List with single TextContent containing JSON string
         """
-        json_str = json.dumps(response)
-        return [TextContent(type="text", text=json_str)]
+        return encode_response(response)
 
     @abstractmethod
     async def run(self, server: JavaErrorCheckerServer) -> None:
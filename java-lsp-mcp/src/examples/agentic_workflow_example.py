@@ -46,7 +46,7 @@ class AgenticJavaCodeGenerator:
             "create_session",
             arguments={"project_name": project_name}
         )
-        response = eval(result.content[0].text)
+        response = json.loads(result.content[0].text)
         self.session_id = response["session_id"]
 
         print(f"✓ Session created: {self.session_id}")
@@ -154,7 +154,7 @@ public class Product {
                 "files": files
             }
         )
-        response = eval(result.content[0].text)
+        response = json.loads(result.content[0].text)
 
         print(f"✓ Batch write complete:")
         print(f"  Files written: {response['written']}")
@@ -266,7 +266,7 @@ public class ProductService {
                 "files": files
             }
         )
-        response = eval(result.content[0].text)
+        response = json.loads(result.content[0].text)
 
         print(f"✓ Batch write complete:")
         print(f"  Files written: {response['written']}")
@@ -343,7 +343,7 @@ public class Main {
                 "files": files
             }
         )
-        response = eval(result.content[0].text)
+        response = json.loads(result.content[0].text)
 
         print(f"✓ Batch write complete:")
         print(f"  Files written: {response['written']}")
@@ -362,7 +362,7 @@ public class Main {
             "check_errors",
             arguments={"session_id": self.session_id}
         )
-        response = eval(result.content[0].text)
+        response = json.loads(result.content[0].text)
 
         if response["error_count"] == 0:
             print(f"  ✓ No compilation errors found!")
@@ -380,7 +380,7 @@ public class Main {
             "refresh_session",
             arguments={"session_id": self.session_id}
         )
-        response = eval(result.content[0].text)
+        response = json.loads(result.content[0].text)
         print(f"  ✓ Session refreshed (timeout extended)")
 
     async def show_session_info(self):
@@ -393,7 +393,7 @@ public class Main {
             "get_session_info",
             arguments={"session_id": self.session_id}
         )
-        response = eval(result.content[0].text)
+        response = json.loads(result.content[0].text)
 
         print(f"Session ID: {response['session_id']}")
         print(f"Project: {response['project_name']}")
@@ -415,7 +415,7 @@ public class Main {
             "delete_session",
             arguments={"session_id": self.session_id}
         )
-        response = eval(result.content[0].text)
+        response = json.loads(result.content[0].text)
         print(f"✓ {response['message']}")
 
 
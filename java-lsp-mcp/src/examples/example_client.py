@@ -15,6 +15,26 @@ from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
 
+class Out:
+    """Buffers output lines and writes them to stdout in one call per flush."""
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self._lines = []
+
+    def line(self, msg: str = ""):
+        """Queue a line of output."""
+        self._lines.append(msg)
+
+    def flush(self):
+        """Write all queued lines to stdout."""
+        if self._lines:
+            self._lines.append("")
+            sys.stdout.write("\n".join(self._lines))
+            sys.stdout.flush()
+            self._lines.clear()
+
+
 # Example Java code with intentional errors
 JAVA_CODE_WITH_ERRORS = """
 package com.example;
@@ -67,259 +87,288 @@ public class Calculator {
 
 async def run_example():
     """Run the example client."""
-    print("=" * 60)
-    print("Java Error Checker MCP Client Example")
-    print("=" * 60)
-
-    # Get the path to the server script
-    server_path = Path(__file__).parent.parent / "server" / "server.py"
-
-    # Set up server parameters
-    server_params = StdioServerParameters(
-        command="python3",
-        args=[str(server_path)],
-        env=None
-    )
-
-    print(f"\n1. Connecting to MCP server at: {server_path}")
-
-    async with stdio_client(server_params) as (read, write):
-        async with ClientSession(read, write) as session:
-            # Initialize the session
-            await session.initialize()
-            print("   ✓ Connected to MCP server")
-
-            # List available tools
-            print("\n2. Listing available tools...")
-            tools = await session.list_tools()
-            print(f"   ✓ Found {len(tools.tools)} tools:")
-            for tool in tools.tools:
-                print(f"     - {tool.name}: {tool.description}")
-
-            # Create a session
-            print("\n3. Creating a new Java project session...")
-            result = await session.call_tool(
-                "create_session",
-                arguments={"project_name": "calculator-example"}
-            )
-            response = eval(result.content[0].text)
-            session_id = response["session_id"]
-            print(f"   ✓ Session created: {session_id}")
-
-            # Write Java file with errors
-            print("\n4. Writing Java file with intentional errors...")
-            result = await session.call_tool(
-                "write_java_file",
-                arguments={
-                    "session_id": session_id,
-                    "file_path": "com/example/Calculator.java",
-                    "content": JAVA_CODE_WITH_ERRORS
-                }
-            )
-            response = eval(result.content[0].text)
-            print(f"   ✓ File written: {response['file_path']}")
-
-            # List files
-            print("\n5. Listing files in workspace...")
-            result = await session.call_tool(
-                "list_files",
-                arguments={"session_id": session_id}
-            )
-            response = eval(result.content[0].text)
-            print(f"   ✓ Found {response['file_count']} file(s):")
-            for file in response['files']:
-                print(f"     - {file}")
-
-            # Check for errors
-            print("\n6. Checking for compilation errors...")
-            result = await session.call_tool(
-                "check_errors",
-                arguments={"session_id": session_id}
-            )
-            response = eval(result.content[0].text)
-            print(f"   ✓ Error check complete")
-            print(f"   ✓ Found {response['error_count']} error(s)")
-
-            if response['error_count'] > 0:
-                print("\n   Errors found:")
-                for i, error in enumerate(response['errors'], 1):
-                    print(f"\n   Error #{i}:")
-                    print(f"     File: {error['file']}")
-                    print(f"     Line: {error['line']}, Column: {error['column']}")
-                    print(f"     Severity: {error['severity']}")
-                    print(f"     Message: {error['message']}")
-                    if 'code' in error:
-                        print(f"     Code: {error['code']}")
-
-                # Get recommendations for first error
-                print("\n7. Getting recommendations for first error...")
+    out = Out()
+    try:
+        out.line("=" * 60)
+        out.line("Java Error Checker MCP Client Example")
+        out.line("=" * 60)
+
+        # Get the path to the server script
+        server_path = Path(__file__).parent.parent / "server" / "server.py"
+
+        # Set up server parameters
+        server_params = StdioServerParameters(
+            command="python3",
+            args=[str(server_path)],
+            env=None
+        )
+
+        out.line(f"\n1. Connecting to MCP server at: {server_path}")
+
+        out.flush()
+        async with stdio_client(server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                # Initialize the session
+                await session.initialize()
+                out.line("   ✓ Connected to MCP server")
+
+                # List available tools
+                out.line("\n2. Listing available tools...")
+                out.flush()
+                tools = await session.list_tools()
+                out.line(f"   ✓ Found {len(tools.tools)} tools:")
+                for tool in tools.tools:
+                    out.line(f"     - {tool.name}: {tool.description}")
+
+                # Create a session
+                out.line("\n3. Creating a new Java project session...")
+                out.flush()
+                result = await session.call_tool(
+                    "create_session",
+                    arguments={"project_name": "calculator-example"}
+                )
+                response = json.loads(result.content[0].text)
+                session_id = response["session_id"]
+                out.line(f"   ✓ Session created: {session_id}")
+
+                # Write Java file with errors
+                out.line("\n4. Writing Java file with intentional errors...")
+                out.flush()
+                result = await session.call_tool(
+                    "write_java_file",
+                    arguments={
+                        "session_id": session_id,
+                        "file_path": "com/example/Calculator.java",
+                        "content": JAVA_CODE_WITH_ERRORS
+                    }
+                )
+                response = json.loads(result.content[0].text)
+                out.line(f"   ✓ File written: {response['file_path']}")
+
+                # List files
+                out.line("\n5. Listing files in workspace...")
+                out.flush()
+                result = await session.call_tool(
+                    "list_files",
+                    arguments={"session_id": session_id}
+                )
+                response = json.loads(result.content[0].text)
+                out.line(f"   ✓ Found {response['file_count']} file(s):")
+                for file in response['files']:
+                    out.line(f"     - {file}")
+
+                # Check for errors
+                out.line("\n6. Checking for compilation errors...")
+                out.flush()
                 result = await session.call_tool(
-                    "get_recommendations",
+                    "check_errors",
+                    arguments={"session_id": session_id}
+                )
+                response = json.loads(result.content[0].text)
+                out.line(f"   ✓ Error check complete")
+                out.line(f"   ✓ Found {response['error_count']} error(s)")
+
+                if response['error_count'] > 0:
+                    out.line("\n   Errors found:")
+                    for i, error in enumerate(response['errors'], 1):
+                        out.line(f"\n   Error #{i}:")
+                        out.line(f"     File: {error['file']}")
+                        out.line(f"     Line: {error['line']}, Column: {error['column']}")
+                        out.line(f"     Severity: {error['severity']}")
+                        out.line(f"     Message: {error['message']}")
+                        if 'code' in error:
+                            out.line(f"     Code: {error['code']}")
+
+                    # Get recommendations for first error
+                    out.line("\n7. Getting recommendations for first error...")
+                    out.flush()
+                    result = await session.call_tool(
+                        "get_recommendations",
+                        arguments={
+                            "session_id": session_id,
+                            "error": response['errors'][0]
+                        }
+                    )
+                    rec_response = json.loads(result.content[0].text)
+                    out.line("   ✓ Recommendations:")
+                    for rec in rec_response['recommendations']:
+                        out.line(f"     - {rec}")
+
+                # Write corrected Java file
+                out.line("\n8. Writing corrected Java file...")
+                out.flush()
+                result = await session.call_tool(
+                    "write_java_file",
                     arguments={
                         "session_id": session_id,
-                        "error": response['errors'][0]
+                        "file_path": "com/example/Calculator.java",
+                        "content": JAVA_CODE_CORRECT
                     }
                 )
-                rec_response = eval(result.content[0].text)
-                print("   ✓ Recommendations:")
-                for rec in rec_response['recommendations']:
-                    print(f"     - {rec}")
-
-            # Write corrected Java file
-            print("\n8. Writing corrected Java file...")
-            result = await session.call_tool(
-                "write_java_file",
-                arguments={
-                    "session_id": session_id,
-                    "file_path": "com/example/Calculator.java",
-                    "content": JAVA_CODE_CORRECT
-                }
-            )
-            print("   ✓ Corrected file written")
-
-            # Check errors again
-            print("\n9. Checking for errors again...")
-            result = await session.call_tool(
-                "check_errors",
-                arguments={"session_id": session_id}
-            )
-            response = eval(result.content[0].text)
-            print(f"   ✓ Error check complete")
-            print(f"   ✓ Found {response['error_count']} error(s)")
-
-            if response['error_count'] == 0:
-                print("   🎉 No errors! Code compiles successfully!")
-
-            # Clean up
-            print("\n10. Cleaning up session...")
-            result = await session.call_tool(
-                "delete_session",
-                arguments={"session_id": session_id}
-            )
-            print("   ✓ Session deleted")
-
-            print("\n" + "=" * 60)
-            print("Example completed successfully!")
-            print("=" * 60)
+                out.line("   ✓ Corrected file written")
+
+                # Check errors again
+                out.line("\n9. Checking for errors again...")
+                out.flush()
+                result = await session.call_tool(
+                    "check_errors",
+                    arguments={"session_id": session_id}
+                )
+                response = json.loads(result.content[0].text)
+                out.line(f"   ✓ Error check complete")
+                out.line(f"   ✓ Found {response['error_count']} error(s)")
+
+                if response['error_count'] == 0:
+                    out.line("   🎉 No errors! Code compiles successfully!")
+
+                # Clean up
+                out.line("\n10. Cleaning up session...")
+                out.flush()
+                result = await session.call_tool(
+                    "delete_session",
+                    arguments={"session_id": session_id}
+                )
+                out.line("   ✓ Session deleted")
+
+                out.line("\n" + "=" * 60)
+                out.line("Example completed successfully!")
+                out.line("=" * 60)
+    finally:
+        # Show queued lines even if a step failed
+        out.flush()
 
 
 async def interactive_mode():
     """Run in interactive mode."""
-    print("=" * 60)
-    print("Java Error Checker MCP Client - Interactive Mode")
-    print("=" * 60)
-
-    server_path = Path(__file__).parent / "server.py"
-    server_params = StdioServerParameters(
-        command="python3",
-        args=[str(server_path)],
-        env=None
-    )
-
-    print(f"\nConnecting to MCP server at: {server_path}")
-
-    async with stdio_client(server_params) as (read, write):
-        async with ClientSession(read, write) as session:
-            await session.initialize()
-            print("✓ Connected to MCP server\n")
-
-            # Create a session
-            result = await session.call_tool(
-                "create_session",
-                arguments={"project_name": "interactive-session"}
-            )
-            response = eval(result.content[0].text)
-            session_id = response["session_id"]
-            print(f"✓ Session created: {session_id}\n")
-
-            print("Commands:")
-            print("  write <file_path>  - Write Java code (multi-line input)")
-            print("  check             - Check for compilation errors")
-            print("  list              - List all files")
-            print("  read <file_path>  - Read a file")
-            print("  quit              - Exit and clean up")
-            print()
-
-            while True:
-                try:
-                    command = input(">>> ").strip()
-
-                    if command == "quit":
-                        break
+    out = Out()
+    try:
+        out.line("=" * 60)
+        out.line("Java Error Checker MCP Client - Interactive Mode")
+        out.line("=" * 60)
+
+        server_path = Path(__file__).parent / "server.py"
+        server_params = StdioServerParameters(
+            command="python3",
+            args=[str(server_path)],
+            env=None
+        )
+
+        out.line(f"\nConnecting to MCP server at: {server_path}")
+
+        out.flush()
+        async with stdio_client(server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                out.line("✓ Connected to MCP server\n")
+
+                # Create a session
+                out.flush()
+                result = await session.call_tool(
+                    "create_session",
+                    arguments={"project_name": "interactive-session"}
+                )
+                response = json.loads(result.content[0].text)
+                session_id = response["session_id"]
+                out.line(f"✓ Session created: {session_id}\n")
+
+                out.line("Commands:")
+                out.line("  write <file_path>  - Write Java code (multi-line input)")
+                out.line("  check             - Check for compilation errors")
+                out.line("  list              - List all files")
+                out.line("  read <file_path>  - Read a file")
+                out.line("  quit              - Exit and clean up")
+                out.line()
+
+                while True:
+                    try:
+                        out.flush()
+                        command = input(">>> ").strip()
+
+                        if command == "quit":
+                            break
+
+                        elif command == "check":
+                            out.flush()
+                            result = await session.call_tool(
+                                "check_errors",
+                                arguments={"session_id": session_id}
+                            )
+                            response = json.loads(result.content[0].text)
+                            out.line(f"\nFound {response['error_count']} error(s)")
+                            for error in response['errors']:
+                                out.line(f"  {error['file']}:{error['line']} - {error['message']}")
+                            out.line()
+
+                        elif command == "list":
+                            out.flush()
+                            result = await session.call_tool(
+                                "list_files",
+                                arguments={"session_id": session_id}
+                            )
+                            response = json.loads(result.content[0].text)
+                            out.line(f"\nFiles ({response['file_count']}):")
+                            for file in response['files']:
+                                out.line(f"  {file}")
+                            out.line()
+
+                        elif command.startswith("write "):
+                            file_path = command[6:].strip()
+                            out.line("Enter Java code (type END on a new line to finish):")
+                            lines = []
+                            while True:
+                                out.flush()
+                                line = input()
+                                if line == "END":
+                                    break
+                                lines.append(line)
+                            content = "\n".join(lines)
+
+                            out.flush()
+                            result = await session.call_tool(
+                                "write_java_file",
+                                arguments={
+                                    "session_id": session_id,
+                                    "file_path": file_path,
+                                    "content": content
+                                }
+                            )
+                            out.line("✓ File written\n")
+
+                        elif command.startswith("read "):
+                            file_path = command[5:].strip()
+                            out.flush()
+                            result = await session.call_tool(
+                                "read_file",
+                                arguments={
+                                    "session_id": session_id,
+                                    "file_path": file_path
+                                }
+                            )
+                            response = json.loads(result.content[0].text)
+                            if response['status'] == 'success':
+                                out.line(f"\n{response['content']}\n")
+                            else:
+                                out.line(f"\nError: {response['message']}\n")
 
-                    elif command == "check":
-                        result = await session.call_tool(
-                            "check_errors",
-                            arguments={"session_id": session_id}
-                        )
-                        response = eval(result.content[0].text)
-                        print(f"\nFound {response['error_count']} error(s)")
-                        for error in response['errors']:
-                            print(f"  {error['file']}:{error['line']} - {error['message']}")
-                        print()
-
-                    elif command == "list":
-                        result = await session.call_tool(
-                            "list_files",
-                            arguments={"session_id": session_id}
-                        )
-                        response = eval(result.content[0].text)
-                        print(f"\nFiles ({response['file_count']}):")
-                        for file in response['files']:
-                            print(f"  {file}")
-                        print()
-
-                    elif command.startswith("write "):
-                        file_path = command[6:].strip()
-                        print("Enter Java code (type END on a new line to finish):")
-                        lines = []
-                        while True:
-                            line = input()
-                            if line == "END":
-                                break
-                            lines.append(line)
-                        content = "\n".join(lines)
-
-                        result = await session.call_tool(
-                            "write_java_file",
-                            arguments={
-                                "session_id": session_id,
-                                "file_path": file_path,
-                                "content": content
-                            }
-                        )
-                        print("✓ File written\n")
-
-                    elif command.startswith("read "):
-                        file_path = command[5:].strip()
-                        result = await session.call_tool(
-                            "read_file",
-                            arguments={
-                                "session_id": session_id,
-                                "file_path": file_path
-                            }
-                        )
-                        response = eval(result.content[0].text)
-                        if response['status'] == 'success':
-                            print(f"\n{response['content']}\n")
                         else:
-                            print(f"\nError: {response['message']}\n")
-
-                    else:
-                        print("Unknown command\n")
-
-                except EOFError:
-                    break
-                except Exception as e:
-                    print(f"Error: {e}\n")
-
-            # Clean up
-            print("\nCleaning up...")
-            await session.call_tool(
-                "delete_session",
-                arguments={"session_id": session_id}
-            )
-            print("✓ Session deleted")
+                            out.line("Unknown command\n")
+
+                    except EOFError:
+                        break
+                    except Exception as e:
+                        out.line(f"Error: {e}\n")
+
+                # Clean up
+                out.line("\nCleaning up...")
+                out.flush()
+                await session.call_tool(
+                    "delete_session",
+                    arguments={"session_id": session_id}
+                )
+                out.line("✓ Session deleted")
+    finally:
+        # Show queued lines even if a step failed
+        out.flush()
 
 
 def main():
@@ -13,6 +13,7 @@ This example creates a LangGraph agent that:
 """
 
 import asyncio
+import functools
 import json
 import os
 import sys
@@ -20,6 +21,7 @@ from typing import Annotated, TypedDict, Sequence
 from pathlib import Path
 
 from langgraph.graph import StateGraph, END
+from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage
 from langchain_openai import ChatOpenAI
@@ -42,7 +44,8 @@ mcp_client = JavaErrorCheckerClient(base_url=MCP_SERVER_URL)
 # Define LangGraph state
 class AgentState(TypedDict):
     """State for the Java code generation agent."""
-    messages: Sequence[BaseMessage]
+    # Nodes return only new messages; add_messages appends them to the history
+    messages: Annotated[Sequence[BaseMessage], add_messages]
     requirements: str
     session_id: str
     current_files: list
@@ -120,14 +123,18 @@ tools = [
     list_project_files,
     refresh_project_session,
 ]
+tools_by_name = {t.name: t for t in tools}
 
 
-# Create LLM with tools
-llm = ChatOpenAI(
-    model="gpt-4",
-    api_key=OPENAI_API_KEY,
-    temperature=0
-).bind_tools(tools)
+# Create LLM with tools on first use, so simple mode runs without an API key
+@functools.lru_cache(maxsize=1)
+def get_llm():
+    """Return the chat model with the project tools bound."""
+    return ChatOpenAI(
+        model="gpt-4",
+        api_key=OPENAI_API_KEY,
+        temperature=0
+    ).bind_tools(tools)
 
 
 # Define graph nodes
@@ -136,13 +143,17 @@ def agent_node(state: AgentState) -> AgentState:
     Agent reasoning node - decides what to do next.
     """
     messages = state["messages"]
-    response = llm.invoke(messages)
-    return {"messages": messages + [response]}
+    response = get_llm().invoke(messages)
+    return {"messages": [response]}
 
 
-def tool_node(state: AgentState) -> AgentState:
+async def tool_node(state: AgentState) -> AgentState:
     """
     Tool execution node - executes tool calls.
+
+    Runs as an async node on the graph's event loop. Calls are awaited in
+    the order the model issued them, since later calls in a turn usually
+    depend on earlier ones (create session -> write -> validate).
     """
     messages = state["messages"]
     last_message = messages[-1]
@@ -151,20 +162,16 @@ def tool_node(state: AgentState) -> AgentState:
     tool_results = []
     if hasattr(last_message, "tool_calls") and last_message.tool_calls:
         for tool_call in last_message.tool_calls:
-            # Find and execute the tool
-            tool_name = tool_call["name"]
-            tool_args = tool_call["args"]
-
-            for t in tools:
-                if t.name == tool_name:
-                    result = asyncio.run(t.func(**tool_args))
-                    tool_results.append(ToolMessage(
-                        content=result,
-                        tool_call_id=tool_call["id"]
-                    ))
-                    break
+            t = tools_by_name.get(tool_call["name"])
+            if t is None:
+                continue
+            result = await t.ainvoke(tool_call["args"])
+            tool_results.append(ToolMessage(
+                content=result,
+                tool_call_id=tool_call["id"]
+            ))
 
-    return {"messages": messages + tool_results}
+    return {"messages": tool_results}
 
 
 def should_continue(state: AgentState) -> str:
@@ -183,8 +190,13 @@ def should_continue(state: AgentState) -> str:
 
 
 # Build the graph
+@functools.lru_cache(maxsize=1)
 def create_agent_graph():
-    """Create the LangGraph workflow."""
+    """Create the LangGraph workflow.
+
+    The topology is static, so the graph is compiled once per process and
+    the compiled graph is reused by every run.
+    """
     workflow = StateGraph(AgentState)
 
     # Add nodes
@@ -332,22 +344,26 @@ public class Main {
             }
         ]
 
-        result = await client.write_multiple_files(files)
+        # Write the files and check them in a single round-trip
+        async with client.pipeline() as pipe:
+            written = pipe.call("write_multiple_files", {"session_id": client.session_id, "files": files})
+            checked = pipe.call("check_errors", {"session_id": client.session_id})
+
+        result = written.result()
         print(f"✓ Wrote {result['written']} files")
 
-        # Check for errors
         print("\nChecking for compilation errors...")
-        errors = await client.check_errors()
+        errors = checked.result()
 
         if errors["error_count"] == 0:
             print("✓ No compilation errors! Code is valid.")
         else:
             print(f"⚠ Found {errors['error_count']} error(s):")
-            for error in errors["errors"]:
-                print(f"  - {error['file']}:{error['line']} - {error['message']}")
 
-                # Get recommendations
-                recs = await client.get_recommendations(error)
+            # Get recommendations for every error in one request
+            all_recs = await client.get_recommendations_batch(errors["errors"])
+            for error, recs in zip(errors["errors"], all_recs):
+                print(f"  - {error['file']}:{error['line']} - {error['message']}")
                 print(f"    Recommendations:")
                 for rec in recs["recommendations"]:
                     print(f"      • {rec}")
@@ -358,6 +374,8 @@ public class Main {
         print(f"  Files: {info['file_count']}")
         print(f"  Age: {info['age_seconds']:.1f}s")
 
+    # Cleanup runs in the background; wait for it before the event loop exits
+    await JavaProjectSession.drain()
     print("\n✓ Session cleaned up automatically")
 
 
@@ -383,32 +401,36 @@ async def main():
     global mcp_client
     mcp_client = JavaErrorCheckerClient(base_url=args.server)
 
-    # Check if server is healthy
+    # One pooled HTTP client serves every call below; close it on the way out
     try:
-        health = await mcp_client.health_check()
-        print(f"✓ Connected to MCP server: {health['service']}")
-        print(f"  Transport: {health['transport']}")
-    except Exception as e:
-        print(f"✗ Failed to connect to MCP server at {args.server}")
-        print(f"  Error: {e}")
-        print(f"\nMake sure the server is running:")
-        print(f"  python server_sse.py --host 0.0.0.0 --port 8000")
-        return
-
-    # Run the appropriate mode
-    if args.mode == "simple":
-        await simple_agent_example()
-    else:
-        # LangGraph mode
-        if OPENAI_API_KEY == "your-api-key-here":
-            print("\n⚠ Warning: OPENAI_API_KEY not set")
-            print("Set it with: export OPENAI_API_KEY=your-key-here")
-            print("\nRunning simple mode instead...")
+        # Check if server is healthy
+        try:
+            health = await mcp_client.health_check()
+            print(f"✓ Connected to MCP server: {health['service']}")
+            print(f"  Transport: {health['transport']}")
+        except Exception as e:
+            print(f"✗ Failed to connect to MCP server at {args.server}")
+            print(f"  Error: {e}")
+            print(f"\nMake sure the server is running:")
+            print(f"  python server_sse.py --host 0.0.0.0 --port 8000")
+            return
+
+        # Run the appropriate mode
+        if args.mode == "simple":
             await simple_agent_example()
         else:
-            await run_java_generation_agent(
-                "Create a simple calculator application with add, subtract, multiply, and divide methods"
-            )
+            # LangGraph mode
+            if OPENAI_API_KEY == "your-api-key-here":
+                print("\n⚠ Warning: OPENAI_API_KEY not set")
+                print("Set it with: export OPENAI_API_KEY=your-key-here")
+                print("\nRunning simple mode instead...")
+                await simple_agent_example()
+            else:
+                await run_java_generation_agent(
+                    "Create a simple calculator application with add, subtract, multiply, and divide methods"
+                )
+    finally:
+        await mcp_client.aclose()
 
 
 if __name__ == "__main__":
@@ -25,7 +25,7 @@ Architecture:
 import asyncio
 import json
 import logging
-from typing import TypedDict, Annotated
+from typing import Optional, TypedDict, Annotated
 from enum import Enum
 
 try:
@@ -579,17 +579,23 @@ public class Application {
 # LangGraph Workflow Setup
 # ============================================================================
 
-def create_workflow(mcp_base_url: str = "http://localhost:8000") -> StateGraph:
+def create_workflow(
+    mcp_base_url: str = "http://localhost:8000",
+    agent: Optional[RemoteJavaCodeGeneratorAgent] = None
+) -> StateGraph:
     """
     Create the LangGraph workflow for remote Java code generation.
 
     Args:
         mcp_base_url: Base URL of the remote MCP service
+        agent: Agent whose methods become the workflow nodes; created for
+            mcp_base_url if not given. Pass one to close its client when done
 
     Returns:
         Compiled StateGraph
     """
-    agent = RemoteJavaCodeGeneratorAgent(mcp_base_url=mcp_base_url)
+    if agent is None:
+        agent = RemoteJavaCodeGeneratorAgent(mcp_base_url=mcp_base_url)
 
     # Create graph
     graph = StateGraph(WorkflowState)
@@ -662,9 +668,10 @@ async def main():
         "status": "Starting workflow"
     }
 
+    agent = RemoteJavaCodeGeneratorAgent(mcp_base_url=args.mcp_url)
     try:
         # Create and run workflow
-        workflow = create_workflow(mcp_base_url=args.mcp_url)
+        workflow = create_workflow(agent=agent)
 
         logger.info("Starting workflow execution...")
         result = await workflow.ainvoke(initial_state)
@@ -684,6 +691,9 @@ async def main():
     except Exception as e:
         logger.error(f"Workflow execution failed: {e}", exc_info=True)
         raise
+    finally:
+        # Release the pooled HTTP connections, whether or not a node failed
+        await agent.client.aclose()
 
 
 if __name__ == "__main__":
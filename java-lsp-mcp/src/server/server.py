@@ -34,6 +34,7 @@ logger = logging.getLogger(__name__)
 
 async def main():
     """Entry point for the stdio MCP server."""
+    server = None
     try:
         server = JavaErrorCheckerServer()
         transport = StdioServerTransport()
@@ -43,6 +44,9 @@ async def main():
     except Exception as e:
         logger.error(f"Server error: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        if server is not None:
+            await server.aclose()
 
 
 if __name__ == "__main__":
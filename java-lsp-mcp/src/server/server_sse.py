@@ -7,7 +7,7 @@ Eliminates duplication by reusing base_server.JavaErrorCheckerServer.
 """
 
 import asyncio
-import json
+import contextlib
 import logging
 import sys
 import os
@@ -17,6 +17,7 @@ from starlette.applications import Starlette
 from starlette.routing import Route
 from starlette.responses import JSONResponse
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 import uvicorn
 
 # Add src directory to path to enable imports
@@ -66,12 +67,19 @@ class SSETransport(JsonResponseTransport):
         self.server_instance = server
         server._register_handlers()
 
+        @contextlib.asynccontextmanager
+        async def lifespan(app):
+            """Shut down JDTLS processes when the app stops."""
+            yield
+            await server.aclose()
+
         # Create Starlette app
         app = Starlette(
             routes=[
                 Route("/sse", self.handle_sse, methods=["POST"]),
                 Route("/health", self.handle_health, methods=["GET"]),
-            ]
+            ],
+            lifespan=lifespan
         )
 
         # Add CORS middleware
@@ -83,6 +91,10 @@ class SSETransport(JsonResponseTransport):
             allow_headers=["*"],
         )
 
+        # Compress larger responses (source files, error lists) for remote
+        # clients; httpx requests and decodes gzip transparently
+        app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
         # Run with uvicorn
         config = uvicorn.Config(
             app,
@@ -96,6 +108,10 @@ class SSETransport(JsonResponseTransport):
     async def handle_sse(self, request):
         """Handle POST requests to /sse endpoint.
 
+        Accepts a single JSON-RPC request or a batch (JSON array) of requests.
+        Batched requests are executed in order and answered with an array;
+        a failing item gets its own error response without affecting the rest.
+
         Args:
             request: Starlette request object
 
@@ -105,73 +121,19 @@ class SSETransport(JsonResponseTransport):
         try:
             body = await request.json()
 
-            # Extract MCP request
-            method = body.get("method")
-            params = body.get("params", {})
-            request_id = body.get("id", 1)
-
-            # Handle different MCP methods
-            if method == "tools/list":
-                result = self.server_instance._get_tools()
-                response = {
-                    "jsonrpc": "2.0",
-                    "result": [{"name": tool.name, "description": tool.description}
-                               for tool in result],
-                    "id": request_id
-                }
-            elif method == "tools/call":
-                tool_name = params.get("name")
-                arguments = params.get("arguments", {})
-
-                # Call the tool
-                text_contents = await self.server_instance._route_tool_call(
-                    tool_name, arguments
-                )
-
-                # Parse the response text as JSON/dict
-                if text_contents:
-                    response_text = text_contents[0].text
-                    try:
-                        # If it looks like a dict string, parse it
-                        if response_text.startswith("{"):
-                            response_data = eval(response_text)
-                        else:
-                            response_data = json.loads(response_text)
-                    except (json.JSONDecodeError, SyntaxError):
-                        response_data = {"text": response_text}
-
-                    response = {
-                        "jsonrpc": "2.0",
-                        "result": response_data,
-                        "id": request_id
-                    }
-                else:
-                    response = {
-                        "jsonrpc": "2.0",
-                        "error": {"code": -32603, "message": "Internal error"},
-                        "id": request_id
-                    }
-            elif method == "initialize":
-                response = {
-                    "jsonrpc": "2.0",
-                    "result": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {},
-                        "serverInfo": {
-                            "name": "java-error-checker",
-                            "version": "1.0.0"
-                        }
-                    },
-                    "id": request_id
-                }
-            else:
-                response = {
-                    "jsonrpc": "2.0",
-                    "error": {"code": -32601, "message": f"Method not found: {method}"},
-                    "id": request_id
-                }
+            if isinstance(body, list):
+                if not body:
+                    return JSONResponse(
+                        {
+                            "jsonrpc": "2.0",
+                            "error": {"code": -32600, "message": "Invalid Request: empty batch"},
+                            "id": None
+                        },
+                        status_code=400
+                    )
+                return JSONResponse([await self._handle_batch_item(item) for item in body])
 
-            return JSONResponse(response)
+            return JSONResponse(await self._handle_rpc(body))
 
         except Exception as e:
             logger.error(f"Error handling SSE request: {e}", exc_info=True)
@@ -184,6 +146,89 @@ class SSETransport(JsonResponseTransport):
                 status_code=400
             )
 
+    async def _handle_batch_item(self, item: Any) -> Dict[str, Any]:
+        """Handle one entry of a batch request.
+
+        Args:
+            item: Decoded batch entry
+
+        Returns:
+            JSON-RPC response object, or an error response carrying the item's id
+        """
+        if not isinstance(item, dict):
+            return {
+                "jsonrpc": "2.0",
+                "error": {"code": -32600, "message": "Invalid Request"},
+                "id": None
+            }
+
+        try:
+            return await self._handle_rpc(item)
+        except Exception as e:
+            logger.error(f"Error handling batch item: {e}", exc_info=True)
+            return {
+                "jsonrpc": "2.0",
+                "error": {"code": -32603, "message": f"Internal error: {str(e)}"},
+                "id": item.get("id")
+            }
+
+    async def _handle_rpc(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a single JSON-RPC request object.
+
+        Args:
+            body: Decoded JSON-RPC request
+
+        Returns:
+            JSON-RPC response object
+        """
+        # Extract MCP request
+        method = body.get("method")
+        params = body.get("params", {})
+        request_id = body.get("id", 1)
+
+        # Handle different MCP methods
+        if method == "tools/list":
+            result = self.server_instance._get_tools()
+            return {
+                "jsonrpc": "2.0",
+                "result": [{"name": tool.name, "description": tool.description}
+                           for tool in result],
+                "id": request_id
+            }
+        elif method == "tools/call":
+            tool_name = params.get("name")
+            arguments = params.get("arguments", {})
+
+            # Call the tool; its dict result is embedded in the JSON-RPC
+            # response directly instead of being serialized as text first
+            response_data = await self.server_instance._dispatch_tool_call(
+                tool_name, arguments
+            )
+
+            return {
+                "jsonrpc": "2.0",
+                "result": response_data,
+                "id": request_id
+            }
+        elif method == "initialize":
+            return {
+                "jsonrpc": "2.0",
+                "result": {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "serverInfo": {
+                        "name": "java-error-checker",
+                        "version": "1.0.0"
+                    }
+                },
+                "id": request_id
+            }
+        return {
+            "jsonrpc": "2.0",
+            "error": {"code": -32601, "message": f"Method not found: {method}"},
+            "id": request_id
+        }
+
     async def handle_health(self, request):
         """Handle GET requests to /health endpoint.
 
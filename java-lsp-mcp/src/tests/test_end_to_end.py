@@ -6,13 +6,40 @@ Tests the complete workflow that a LangGraph agent would follow.
 """
 
 import sys
+import os
+import json
+import time
 import asyncio
 from pathlib import Path
+from typing import Awaitable, Dict, TypeVar
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.base_server import JavaErrorCheckerServer
-import json
+
+T = TypeVar("T")
+
+
+async def _timed(timings: Dict[str, int], stage: str, call: Awaitable[T]) -> T:
+    """Await a server call and record its duration in nanoseconds."""
+    start = time.perf_counter_ns()
+    try:
+        return await call
+    finally:
+        timings[stage] = time.perf_counter_ns() - start
+
+
+def _report_timings(timings: Dict[str, int]):
+    """Print per-stage durations; also emit JSONL to stderr if E2E_TIMINGS is set."""
+    print("\nStage timings:\n" + "\n".join(
+        f"  {stage:<24} {duration / 1e6:8.2f} ms" for stage, duration in timings.items()
+    ))
+    if os.environ.get("E2E_TIMINGS"):
+        sys.stderr.write("".join(
+            json.dumps({"stage": stage, "ns": duration}) + "\n"
+            for stage, duration in timings.items()
+        ))
+
 
 async def test_end_to_end():
     """
@@ -28,14 +55,15 @@ async def test_end_to_end():
     print("End-to-End Test: Simulating Agentic Workflow")
     print("=" * 60)
 
+    timings: Dict[str, int] = {}
+
     # Initialize server
     server = JavaErrorCheckerServer()
     print("\n✓ Server initialized")
 
     # Stage 1: Create Session
     print("\n[Stage 1] Creating session...")
-    result = await server._handle_create_session({"project_name": "calculator-app"})
-    response = eval(result[0].text)  # Server returns str(dict), not JSON
+    response = await _timed(timings, "create_session", server._handle_create_session({"project_name": "calculator-app"}))
     session_id = response["session_id"]
     print(f"✓ Session created: {session_id[:8]}...")
     print(f"  Project: {response['project_name']}")
@@ -73,18 +101,16 @@ public class Main {
         }
     ]
 
-    result = await server._handle_write_multiple_files({
+    response = await _timed(timings, "write_files", server._handle_write_multiple_files({
         "session_id": session_id,
         "files": files_with_errors
-    })
-    response = eval(result[0].text)
+    }))
     print(f"✓ Files written: {response['written']} files")
     print(f"  Failed: {response['failed']}")
 
     # Stage 3: Check for errors
     print("\n[Stage 3] Checking for compilation errors...")
-    result = await server._handle_check_errors({"session_id": session_id})
-    response = eval(result[0].text)
+    response = await _timed(timings, "check_errors", server._handle_check_errors({"session_id": session_id}))
     print(f"✓ Error check complete")
     print(f"  Errors found: {response['error_count']}")
 
@@ -99,25 +125,22 @@ public class Main {
         # Stage 4: Get recommendations
         print("\n[Stage 4] Getting fix recommendations...")
         first_error = response['errors'][0]
-        result = await server._handle_get_recommendations({
+        rec_response = await _timed(timings, "get_recommendations", server._handle_get_recommendations({
             "session_id": session_id,
             "error": first_error
-        })
-        rec_response = eval(result[0].text)
+        }))
         print(f"✓ Recommendations generated:")
         for i, rec in enumerate(rec_response['recommendations'], 1):
             print(f"    {i}. {rec}")
 
     # Stage 5: Refresh session (simulate long workflow)
     print("\n[Stage 5] Refreshing session...")
-    result = await server._handle_refresh_session({"session_id": session_id})
-    response = eval(result[0].text)
+    response = await _timed(timings, "refresh_session", server._handle_refresh_session({"session_id": session_id}))
     print(f"✓ Session refreshed: {response['status']}")
 
     # Stage 6: Get session info
     print("\n[Stage 6] Getting session info...")
-    result = await server._handle_get_session_info({"session_id": session_id})
-    response = eval(result[0].text)
+    response = await _timed(timings, "get_session_info", server._handle_get_session_info({"session_id": session_id}))
     print(f"✓ Session info:")
     print(f"    Files: {response['file_count']}")
     print(f"    Age: {response['age_seconds']:.2f}s")
@@ -156,44 +179,45 @@ public class Main {
         }
     ]
 
-    result = await server._handle_write_multiple_files({
+    response = await _timed(timings, "write_fixed_files", server._handle_write_multiple_files({
         "session_id": session_id,
         "files": fixed_files
-    })
-    response = eval(result[0].text)
+    }))
     print(f"✓ Fixed files written: {response['written']} files")
 
     # Stage 8: Verify no errors
     print("\n[Stage 8] Re-checking for errors...")
-    result = await server._handle_check_errors({"session_id": session_id})
-    response = eval(result[0].text)
+    response = await _timed(timings, "recheck_errors", server._handle_check_errors({"session_id": session_id}))
     print(f"✓ Error check complete")
     print(f"  Errors found: {response['error_count']}")
 
     if response['error_count'] == 0:
         print("  🎉 Success! Code compiles without errors!")
 
+    # Stages 9 and 10 are independent reads, so issue them concurrently
+    files_response, read_response = await _timed(timings, "list_and_read_files", asyncio.gather(
+        server._handle_list_files({"session_id": session_id}),
+        server._handle_read_file({
+            "session_id": session_id,
+            "file_path": "com/example/Calculator.java"
+        })
+    ))
+
     # Stage 9: List all files
     print("\n[Stage 9] Listing all files...")
-    result = await server._handle_list_files({"session_id": session_id})
-    response = eval(result[0].text)
+    response = files_response
     print(f"✓ Files in project:")
     for file in response['files']:
         print(f"    - {file}")
 
     # Stage 10: Read a file
     print("\n[Stage 10] Reading Calculator.java...")
-    result = await server._handle_read_file({
-        "session_id": session_id,
-        "file_path": "com/example/Calculator.java"
-    })
-    response = eval(result[0].text)
+    response = read_response
     print(f"✓ File read successfully ({len(response['content'])} chars)")
 
     # Stage 11: Cleanup
     print("\n[Stage 11] Cleaning up...")
-    result = await server._handle_delete_session({"session_id": session_id})
-    response = eval(result[0].text)
+    response = await _timed(timings, "delete_session", server._handle_delete_session({"session_id": session_id}))
     print(f"✓ Session deleted: {response['status']}")
 
     print("\n" + "=" * 60)
@@ -209,5 +233,7 @@ public class Main {
     print("  ✓ File operations")
     print("  ✓ Cleanup")
 
+    _report_timings(timings)
+
 if __name__ == "__main__":
     asyncio.run(test_end_to_end())
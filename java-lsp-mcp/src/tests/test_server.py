@@ -2,33 +2,44 @@
 Unit tests for Java Error Checker MCP Service
 """
 
+import asyncio
+import json
+import os
 import unittest
 import tempfile
 import shutil
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.session_manager import SessionManager
-from core.jdtls_client import JDTLSClient
+from core.jdtls_client import JDTLSClient, JDTLSPool
 
 
 class TestSessionManager(unittest.TestCase):
-    """Test SessionManager functionality."""
+    """Test SessionManager functionality.
 
-    def setUp(self):
+    The manager is shared by all tests; each test works in its own session
+    and deletes it when done.
+    """
+
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.session_manager = SessionManager(base_workspace_dir=self.temp_dir)
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.session_manager = SessionManager(base_workspace_dir=cls.temp_dir)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
 
     def test_create_session(self):
         """Test session creation."""
         session_id = self.session_manager.create_session("test-project")
+        self.addCleanup(self.session_manager.delete_session, session_id)
         self.assertIsNotNone(session_id)
 
         session = self.session_manager.get_session(session_id)
@@ -38,6 +49,7 @@ class TestSessionManager(unittest.TestCase):
     def test_write_and_read_file(self):
         """Test writing and reading files."""
         session_id = self.session_manager.create_session()
+        self.addCleanup(self.session_manager.delete_session, session_id)
 
         # Write file
         content = "public class Test { }"
@@ -58,6 +70,7 @@ class TestSessionManager(unittest.TestCase):
     def test_list_files(self):
         """Test listing files."""
         session_id = self.session_manager.create_session()
+        self.addCleanup(self.session_manager.delete_session, session_id)
 
         # Write multiple files
         self.session_manager.write_file(
@@ -77,9 +90,59 @@ class TestSessionManager(unittest.TestCase):
         self.assertTrue(any("Test1.java" in f for f in files))
         self.assertTrue(any("Test2.java" in f for f in files))
 
+    def test_list_files_rescan(self):
+        """Test the file listing is rebuilt from disk when not tracked."""
+        session_id = self.session_manager.create_session()
+        self.addCleanup(self.session_manager.delete_session, session_id)
+        self.session_manager.write_file(
+            session_id,
+            "com/example/Test1.java",
+            "public class Test1 { }"
+        )
+
+        self.session_manager._files.pop(session_id)
+        files = self.session_manager.list_files(session_id)
+        self.assertEqual(files, [str(Path("src/main/java/com/example/Test1.java"))])
+
+    def test_list_files_normalizes_paths(self):
+        """Test differently spelled paths to one file are listed once, as a rescan lists them."""
+        session_id = self.session_manager.create_session()
+        self.addCleanup(self.session_manager.delete_session, session_id)
+        self.session_manager.write_file(session_id, "com/example/Test.java", "public class Test { }")
+        self.session_manager.write_file(session_id, "com/other/../example/Test.java", "public class Test { }")
+        self.session_manager.write_file(session_id, "./com/example/Other.java", "public class Other { }")
+
+        files = self.session_manager.list_files(session_id)
+        self.session_manager._files.pop(session_id)
+        self.assertEqual(files, self.session_manager.list_files(session_id))
+        self.assertEqual(len(files), 2)
+
+    def test_write_multiple_files(self):
+        """Test batch writes, including repeated paths and invalid entries."""
+        session_id = self.session_manager.create_session()
+        self.addCleanup(self.session_manager.delete_session, session_id)
+        files = [
+            {"file_path": f"com/example/Test{i}.java", "content": f"public class Test{i} {{ }}"}
+            for i in range(10)
+        ]
+        files.append({"file_path": "com/example/Test0.java", "content": "public class Test0 { int x; }"})
+        files.append({"file_path": "com/example/Broken.java"})
+
+        result = self.session_manager.write_multiple_files(session_id, files)
+        self.assertEqual((result["written"], result["failed"], result["total"]), (11, 1, 12))
+        self.assertEqual(result["failed_files"][0]["file_path"], "com/example/Broken.java")
+
+        # Later entries for the same path win
+        self.assertEqual(
+            self.session_manager.read_file(session_id, "com/example/Test0.java"),
+            "public class Test0 { int x; }"
+        )
+        self.assertEqual(len(self.session_manager.list_files(session_id)), 10)
+
     def test_delete_session(self):
         """Test session deletion."""
         session_id = self.session_manager.create_session()
+        self.addCleanup(self.session_manager.delete_session, session_id)
         self.assertIsNotNone(self.session_manager.get_session(session_id))
 
         # Delete session
@@ -90,6 +153,7 @@ class TestSessionManager(unittest.TestCase):
     def test_workspace_path(self):
         """Test getting workspace path."""
         session_id = self.session_manager.create_session()
+        self.addCleanup(self.session_manager.delete_session, session_id)
         workspace_path = self.session_manager.get_workspace_path(session_id)
 
         self.assertIsNotNone(workspace_path)
@@ -97,16 +161,71 @@ class TestSessionManager(unittest.TestCase):
         self.assertTrue(workspace_path.is_dir())
 
 
+class _FakeLSPStdin:
+    """Stands in for JDTLS's stdin, answering build requests with diagnostics.
+
+    Diagnostics carry the last version sent for each document. With a
+    publish_delay they are published that long after the build reply, after
+    an immediate stale (empty, previous version) publish.
+    """
+
+    def __init__(self, client: JDTLSClient, diagnostics, build_status: int = 1,
+                 publish_delay: float = 0):
+        self.client = client
+        self.diagnostics = diagnostics
+        self.build_status = build_status
+        self.publish_delay = publish_delay
+        self.versions = {}
+        self.messages = []
+
+    def _publish(self, uri: str, diagnostics, version: int):
+        asyncio.ensure_future(self.client._handle_message({
+            "jsonrpc": "2.0",
+            "method": "textDocument/publishDiagnostics",
+            "params": {"uri": uri, "version": version, "diagnostics": diagnostics}
+        }))
+
+    def write(self, data: bytes):
+        message = json.loads(data.split(b"\r\n\r\n", 1)[1])
+        self.messages.append(message)
+        method = message.get("method")
+        if method in ("textDocument/didOpen", "textDocument/didChange"):
+            document = message["params"]["textDocument"]
+            self.versions[document["uri"]] = document["version"]
+        elif method == "java/buildWorkspace":
+            loop = asyncio.get_running_loop()
+            for uri, diagnostics in self.diagnostics.items():
+                version = self.versions.get(uri, 0)
+                if self.publish_delay:
+                    self._publish(uri, [], version - 1)
+                    loop.call_later(self.publish_delay, self._publish, uri, diagnostics, version)
+                else:
+                    self._publish(uri, diagnostics, version)
+            asyncio.ensure_future(self.client._handle_message(
+                {"jsonrpc": "2.0", "id": message["id"], "result": self.build_status}
+            ))
+
+    async def drain(self):
+        pass
+
+    def methods(self):
+        return [message.get("method") for message in self.messages]
+
+
 class TestJDTLSClient(unittest.TestCase):
     """Test JDTLSClient functionality."""
 
     def setUp(self):
-        """Set up test fixtures."""
+        """Set up test fixtures.
+
+        Tests fill the client's pending requests, diagnostics and compile
+        caches, so each gets its own client.
+        """
         self.jdtls_client = JDTLSClient()
 
     def test_parse_javac_errors(self):
         """Test parsing javac error output."""
-        error_output = """
+        error_output = b"""
 Test.java:5: error: ';' expected
         return a + b
                     ^
@@ -133,6 +252,192 @@ Test.java:8: error: cannot find symbol
         self.assertEqual(errors[1]['line'], 8)
         self.assertIn("cannot find symbol", errors[1]['message'])
 
+    def test_handle_lsp_messages(self):
+        """Test dispatching JDTLS responses and diagnostics."""
+        async def dispatch():
+            future = asyncio.get_running_loop().create_future()
+            self.jdtls_client._pending[1] = future
+            await self.jdtls_client._handle_message(
+                {"jsonrpc": "2.0", "id": 1, "result": {"capabilities": {}}}
+            )
+            await self.jdtls_client._handle_message({
+                "jsonrpc": "2.0",
+                "method": "textDocument/publishDiagnostics",
+                "params": {
+                    "uri": "file:///tmp/Test.java",
+                    "diagnostics": [{"message": "';' expected", "severity": 1}]
+                }
+            })
+            return await future
+
+        result = asyncio.run(dispatch())
+        self.assertEqual(result, {"capabilities": {}})
+        self.assertEqual(
+            self.jdtls_client._diagnostics["file:///tmp/Test.java"][0]["message"],
+            "';' expected"
+        )
+
+    def test_check_with_lsp(self):
+        """Test sources are synced to JDTLS and diagnostics filtered by strictness."""
+        workspace = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, workspace, ignore_errors=True)
+        java_file = workspace / "Test.java"
+        java_file.write_text("public class Test { }")
+        uri = java_file.as_uri()
+
+        client = self.jdtls_client
+        stdin = _FakeLSPStdin(client, {uri: [
+            {"message": "';' expected", "severity": 1,
+             "range": {"start": {"line": 4, "character": 2}}},
+            {"message": "unused import", "severity": 2,
+             "range": {"start": {"line": 0, "character": 0}}},
+        ]})
+        client.process = SimpleNamespace(returncode=None, stdin=stdin)
+        client.workspace_path = workspace
+
+        errors = asyncio.run(client.check_compilation_errors(workspace))
+        self.assertEqual(errors, [{"file": "Test.java", "line": 5, "column": 2,
+                                   "severity": "error", "message": "';' expected"}])
+        self.assertEqual(stdin.methods(), [
+            "textDocument/didOpen", "workspace/didChangeWatchedFiles", "java/buildWorkspace"
+        ])
+        self.assertEqual(stdin.messages[0]["params"]["textDocument"]["text"], "public class Test { }")
+        self.assertIs(stdin.messages[-1]["params"], False)
+
+        stdin.messages.clear()
+        java_file.write_text("public class Test { int x; }")
+        errors = asyncio.run(client.check_compilation_errors(workspace, strict=True, rebuild=True))
+        self.assertEqual([e["severity"] for e in errors], ["error", "warning"])
+        self.assertEqual(stdin.methods(), [
+            "textDocument/didChange", "workspace/didChangeWatchedFiles", "java/buildWorkspace"
+        ])
+        self.assertEqual(stdin.messages[0]["params"]["textDocument"]["version"], 2)
+        self.assertIs(stdin.messages[-1]["params"], True)
+
+        stdin.build_status = 0
+        with self.assertRaises(RuntimeError):
+            asyncio.run(client._check_with_lsp(workspace, client._prepare_sources(workspace, True)[1]))
+
+    def test_check_with_lsp_waits_for_late_diagnostics(self):
+        """Test diagnostics published after the build reply are waited for."""
+        workspace = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, workspace, ignore_errors=True)
+        java_file = workspace / "Test.java"
+        java_file.write_text("public class Test { int x }")
+
+        client = self.jdtls_client
+        stdin = _FakeLSPStdin(client, {java_file.as_uri(): [
+            {"message": "';' expected", "severity": 1,
+             "range": {"start": {"line": 0, "character": 25}}},
+        ]}, publish_delay=0.05)
+        client.process = SimpleNamespace(returncode=None, stdin=stdin)
+        client.workspace_path = workspace
+
+        errors = asyncio.run(client.check_compilation_errors(workspace))
+        self.assertEqual([e["message"] for e in errors], ["';' expected"])
+
+    def test_forget_workspace(self):
+        """Test a deleted workspace's state is dropped and other workspaces' kept."""
+        client = self.jdtls_client
+        for workspace in (Path("/tmp/ws-a"), Path("/tmp/ws-ab")):
+            uri = (workspace / "Test.java").as_uri()
+            client._compiled_sources[workspace] = (False, frozenset())
+            client._open_documents[uri] = (1, (0, 0))
+            client._diagnostics[uri] = []
+
+        client.forget_workspace(Path("/tmp/ws-a"))
+        self.assertEqual(list(client._compiled_sources), [Path("/tmp/ws-ab")])
+        self.assertEqual(list(client._open_documents), ["file:///tmp/ws-ab/Test.java"])
+        self.assertEqual(list(client._diagnostics), ["file:///tmp/ws-ab/Test.java"])
+
+    def test_iter_java_files_exclusions(self):
+        """Test build output is skipped only directly under the workspace root."""
+        from core.jdtls_client import _iter_java_files
+
+        workspace = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, workspace, ignore_errors=True)
+        for relative in ("src/main/java/com/example/build/Builder.java",
+                         "src/main/java/com/example/out/Output.java",
+                         "target/generated/Generated.java",
+                         ".git/Hidden.java"):
+            (workspace / relative).parent.mkdir(parents=True, exist_ok=True)
+            (workspace / relative).write_text("class X { }")
+
+        found = {Path(entry.path).relative_to(workspace).as_posix()
+                 for entry in _iter_java_files(str(workspace))}
+        self.assertEqual(found, {
+            "src/main/java/com/example/build/Builder.java",
+            "src/main/java/com/example/out/Output.java",
+        })
+
+    def test_incremental_check_reports_each_error_once(self):
+        """Test unchanged files' errors are reused, not merged with javac's repeats."""
+        workspace = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, workspace, ignore_errors=True)
+        src_dir = workspace / "src" / "main" / "java"
+        src_dir.mkdir(parents=True)
+        (src_dir / "A.java").write_text("class A { }")
+        (src_dir / "B.java").write_text("class B { int x }")
+
+        def error(name: str, message: str):
+            return {"file": f"src/main/java/{name}", "line": 1, "column": 0,
+                    "severity": "error", "message": message}
+
+        compiled = []
+
+        async def compile_files(java_files, workspace_path, output_dir, strict=False):
+            # javac reports B's error whenever it compiles or resolves B
+            compiled.append(sorted(f.name for f in java_files))
+            errors = [error("B.java", "';' expected")]
+            if "class A { int y }" in (src_dir / "A.java").read_text():
+                errors.insert(0, error("A.java", "';' expected"))
+            return errors
+
+        client = self.jdtls_client
+        client._compile_files = compile_files
+        first = asyncio.run(client.check_compilation_errors(workspace, incremental=True))
+        self.assertEqual(first, [error("B.java", "';' expected")])
+
+        (src_dir / "A.java").write_text("class A { int y }")
+        second = asyncio.run(client.check_compilation_errors(workspace, incremental=True))
+        self.assertEqual(compiled, [["A.java", "B.java"], ["A.java"]])
+        self.assertEqual(
+            sorted(e["file"] for e in second),
+            ["src/main/java/A.java", "src/main/java/B.java"]
+        )
+
+    def test_compile_cache_invalidation(self):
+        """Test cached javac results are dropped when a source file changes."""
+        workspace = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, workspace, ignore_errors=True)
+        java_file = workspace / "Test.java"
+        java_file.write_text("public class Test { }")
+
+        keys = [self.jdtls_client._compile_cache_key(java_file)]
+        error = {"file": "Test.java", "line": 1, "column": 0,
+                 "severity": "error", "message": "';' expected"}
+        self.jdtls_client._store_compile_results(workspace, [java_file], keys, [error])
+        self.assertEqual(self.jdtls_client._get_cached_results(workspace, keys), [error])
+
+        java_file.write_text("public class Test { int x; }")
+        keys = [self.jdtls_client._compile_cache_key(java_file)]
+        self.assertIsNone(self.jdtls_client._get_cached_results(workspace, keys))
+
+    def test_compile_cache_identical_rewrite(self):
+        """Test cached javac results survive rewriting a file with the same content."""
+        workspace = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, workspace, ignore_errors=True)
+        java_file = workspace / "Test.java"
+        java_file.write_text("public class Test { }")
+
+        keys = [self.jdtls_client._compile_cache_key(java_file)]
+        self.jdtls_client._store_compile_results(workspace, [java_file], keys, [])
+
+        java_file.write_text("public class Test { }")
+        os.utime(java_file, ns=(0, 0))
+        keys = [self.jdtls_client._compile_cache_key(java_file)]
+        self.assertEqual(self.jdtls_client._get_cached_results(workspace, keys), [])
+
     def test_generate_recommendations_semicolon(self):
         """Test recommendation generation for missing semicolon."""
         from core.error_recommendation_engine import ErrorRecommendationEngine
@@ -168,6 +473,323 @@ Test.java:8: error: cannot find symbol
                 for r in recommendations)
         )
 
+    def test_register_single_argument_strategy(self):
+        """Test custom strategies using the can_handle(self, error) signature."""
+        from core.error_recommendation_engine import (
+            ErrorRecommendationEngine,
+            RecommendationStrategy,
+        )
+
+        class LegacyStrategy(RecommendationStrategy):
+            def can_handle(self, error):
+                return "legacy pattern" in error.get("message", "").lower()
+
+            def get_recommendations(self, error):
+                return ["Legacy recommendation"]
+
+        class BrokenStrategy(RecommendationStrategy):
+            def can_handle(self, error):
+                raise RuntimeError("broken")
+
+            def get_recommendations(self, error):
+                return ["Unreachable"]
+
+        engine = ErrorRecommendationEngine()
+        engine.register_strategy(LegacyStrategy())
+        engine.register_strategy(BrokenStrategy())
+
+        self.assertEqual(
+            list(engine.get_recommendations({"message": "Legacy Pattern found"})),
+            ["Legacy recommendation"]
+        )
+        # Built-in strategies still match after the failing custom one
+        self.assertTrue(any(
+            "semicolon" in r.lower()
+            for r in engine.get_recommendations({"message": "';' expected"})
+        ))
+
+
+class _FakePoolClient:
+    """JDTLSClient stand-in that starts instantly, or fails while the pool says so."""
+
+    def __init__(self, pool: "_FakeJDTLSPool"):
+        self.pool = pool
+        self.workspace_path = None
+        self.is_running = False
+
+    async def start_server(self, workspace_path: Path):
+        self.pool.starts += 1
+        if self.pool.failures:
+            self.pool.failures -= 1
+            raise RuntimeError("JDTLS failed to start")
+        self.workspace_path = workspace_path
+        self.is_running = True
+
+    async def switch_workspace(self, workspace_path: Path):
+        self.workspace_path = workspace_path
+
+    async def stop_server(self):
+        self.is_running = False
+        self.pool.stopped.append(self)
+
+
+class _FakeJDTLSPool(JDTLSPool):
+    """JDTLSPool handing out _FakePoolClient instances."""
+
+    def __init__(self, size: int = 2, failures: int = 0):
+        super().__init__(None, None, size=size, retry_delay=0.01)
+        self.failures = failures
+        self.starts = 0
+        self.stopped = []
+
+    def _new_client(self):
+        return _FakePoolClient(self)
+
+
+async def _wait_for(condition, timeout: float = 2.0):
+    """Poll until condition() is true, yielding to the event loop."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("Condition not met in time")
+        await asyncio.sleep(0.005)
+
+
+class TestJDTLSPool(unittest.TestCase):
+    """Test the warm JDTLS process pool and its shutdown."""
+
+    def test_fill_retries_failed_starts(self):
+        """Test the pool backs off and retries when processes fail to start."""
+        async def fill():
+            pool = _FakeJDTLSPool(size=2, failures=2)
+            pool.ensure_started()
+            await _wait_for(lambda: pool._queue.full())
+            await pool.close()
+            return pool
+
+        pool = asyncio.run(fill())
+        self.assertEqual(pool.starts, 4)
+
+    def test_acquire_refill_and_close(self):
+        """Test a warm client is switched to the workspace and the pool refills."""
+        workspace = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, workspace, ignore_errors=True)
+
+        async def run():
+            pool = _FakeJDTLSPool(size=2)
+            pool.ensure_started()
+            await _wait_for(lambda: pool._queue.full())
+
+            client = await pool.acquire(workspace)
+            self.assertTrue(client.is_running)
+            self.assertEqual(client.workspace_path, workspace)
+            await _wait_for(lambda: pool._queue.full())
+            self.assertEqual(pool.starts, 3)
+
+            warm = list(pool._queue._queue)
+            await pool.close()
+            self.assertTrue(pool._queue.empty())
+            self.assertIsNone(pool._fill_task)
+            self.assertTrue(all(not c.is_running for c in warm))
+            self.assertTrue(client.is_running)
+
+        asyncio.run(run())
+
+    def test_server_stops_clients(self):
+        """Test JDTLS processes are stopped on session deletion and server shutdown."""
+        from core.base_server import JavaErrorCheckerServer
+
+        async def run():
+            server = JavaErrorCheckerServer()
+            server.jdtls_pool = _FakeJDTLSPool(size=0)
+            server.jdtls_client.jdtls_path = server.jdtls_client.java_home = Path(tempfile.gettempdir())
+
+            deleted_id = server.session_manager.create_session()
+            kept_id = server.session_manager.create_session()
+            deleted_path = server.session_manager.get_workspace_path(deleted_id)
+            deleted = await server._get_jdtls_client(deleted_path)
+            kept = await server._get_jdtls_client(server.session_manager.get_workspace_path(kept_id))
+            server.jdtls_client._compiled_sources[deleted_path] = (False, frozenset())
+
+            await server._dispatch_tool_call("delete_session", {"session_id": deleted_id})
+            await _wait_for(lambda: not deleted.is_running)
+            self.assertTrue(kept.is_running)
+            self.assertNotIn(deleted_path, server.jdtls_client._compiled_sources)
+
+            await server.aclose()
+            self.assertFalse(kept.is_running)
+            self.assertEqual(server.lsp_clients, {})
+            server.session_manager.delete_session(kept_id)
+
+        asyncio.run(run())
+
+
+class TestCheckScheduling(unittest.TestCase):
+    """Test concurrent check_errors calls against a javac that logs its runs."""
+
+    def setUp(self):
+        """Put a fake javac, which logs start and end of each run, on PATH."""
+        from unittest import mock
+        from core import jdtls_client
+        from core.base_server import JavaErrorCheckerServer
+
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.log = self.temp_dir / "javac.log"
+        bin_dir = self.temp_dir / "bin"
+        bin_dir.mkdir()
+        javac = bin_dir / "javac"
+        javac.write_text(f"#!/bin/sh\necho start >> {self.log}\nsleep 0.2\necho end >> {self.log}\n")
+        javac.chmod(0o755)
+
+        patcher = mock.patch.dict(os.environ, {"PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for locate in (jdtls_client._locate_javac, jdtls_client._locate_javac_command):
+            locate.cache_clear()
+            self.addCleanup(locate.cache_clear)
+
+        self.server = JavaErrorCheckerServer()
+        self.server.jdtls_client.jdtls_path = None
+        self.server.session_manager = SessionManager(base_workspace_dir=str(self.temp_dir / "ws"))
+        self.session_id = self.server.session_manager.create_session()
+        self.server.session_manager.write_file(self.session_id, "Test.java", "class Test { }")
+        self.workspace = self.server.session_manager.get_workspace_path(self.session_id)
+
+    def _runs(self):
+        """Return the fake javac's log lines."""
+        return self.log.read_text().split() if self.log.exists() else []
+
+    def test_concurrent_checks_share_one_compile(self):
+        """Test identical concurrent checks run javac once."""
+        async def check():
+            return await asyncio.gather(*(
+                self.server._check_workspace(self.workspace) for _ in range(3)
+            ))
+
+        self.assertEqual(asyncio.run(check()), [[], [], []])
+        self.assertEqual(self._runs(), ["start", "end"])
+
+    def test_checks_after_write_wait_for_running_check(self):
+        """Test a check started after a write runs once the earlier check ends."""
+        async def check():
+            first = asyncio.ensure_future(self.server._check_workspace(self.workspace))
+            await asyncio.sleep(0.05)
+            await self.server._dispatch_tool_call("write_java_file", {
+                "session_id": self.session_id,
+                "file_path": "Test.java",
+                "content": "class Test { int x; }"
+            })
+            second = self.server._check_workspace(self.workspace, strict=True)
+            return await asyncio.gather(first, second)
+
+        self.assertEqual(asyncio.run(check()), [[], []])
+        self.assertEqual(self._runs(), ["start", "end", "start", "end"])
+
+
+class TestHTTPTransport(unittest.TestCase):
+    """Test the HTTP/SSE endpoint and the HTTP client batching helpers."""
+
+    def setUp(self):
+        """Set up an in-process server and a client routed to it."""
+        import httpx
+        from starlette.applications import Starlette
+        from starlette.routing import Route
+        from core.base_server import JavaErrorCheckerServer
+        from server.server_sse import SSETransport
+        from client.langgraph_integration import JavaErrorCheckerClient
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+
+        transport = SSETransport()
+        transport.server_instance = JavaErrorCheckerServer()
+        transport.server_instance.session_manager = SessionManager(
+            base_workspace_dir=self.temp_dir
+        )
+        app = Starlette(routes=[Route("/sse", transport.handle_sse, methods=["POST"])])
+
+        self.client = JavaErrorCheckerClient("http://test")
+        self.client._client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        )
+
+    def _run(self, coro):
+        """Run a coroutine, closing the client's HTTP connection afterwards."""
+        async def run():
+            try:
+                return await coro
+            finally:
+                await self.client.aclose()
+        return asyncio.run(run())
+
+    def test_batch_endpoint_item_errors(self):
+        """Test a failing batch item does not fail the other items."""
+        async def post():
+            http = await self.client._get_client()
+            response = await http.post("/sse", json=[
+                {"jsonrpc": "2.0", "method": "initialize", "id": 3},
+                "not an object",
+                {"jsonrpc": "2.0", "method": "tools/call", "params": "bad", "id": 7},
+            ])
+            return response.status_code, response.json()
+
+        status, body = self._run(post())
+        self.assertEqual(status, 200)
+        self.assertEqual(len(body), 3)
+        self.assertEqual(body[0]["id"], 3)
+        self.assertIn("result", body[0])
+        self.assertEqual(body[1]["error"]["code"], -32600)
+        self.assertIsNone(body[1]["id"])
+        self.assertEqual(body[2]["error"]["code"], -32603)
+        self.assertEqual(body[2]["id"], 7)
+
+    def test_call_tools_batch(self):
+        """Test batched tool calls are answered in order."""
+        async def calls():
+            session_id = await self.client.create_session("batch-test")
+            return session_id, await self.client._call_tools_batch([
+                ("write_java_file", {"session_id": session_id,
+                                     "file_path": "com/example/Test.java",
+                                     "content": "public class Test { }"}),
+                ("read_file", {"session_id": session_id,
+                               "file_path": "com/example/Test.java"}),
+            ])
+
+        session_id, (written, read) = self._run(calls())
+        self.assertEqual(written["status"], "success")
+        self.assertEqual(read["content"], "public class Test { }")
+
+    def test_pipeline(self):
+        """Test pipelined calls resolve their futures once the block exits."""
+        async def calls():
+            session_id = await self.client.create_session("pipeline-test")
+            async with self.client.pipeline() as pipe:
+                listed = pipe.call("list_files", {"session_id": session_id})
+                missing = pipe.call("no_such_tool", {})
+                self.assertFalse(listed.done())
+            return listed.result(), missing.result()
+
+        listed, missing = self._run(calls())
+        self.assertEqual(listed["files"], [])
+        self.assertEqual(missing["status"], "error")
+
+    def test_parse_tool_result(self):
+        """Test MCP content lists and plain results are both decoded."""
+        from client.langgraph_integration import JavaErrorCheckerClient
+
+        parse = JavaErrorCheckerClient._parse_tool_result
+        self.assertEqual(
+            parse({"result": {"content": [{"type": "text", "text": '{"success": true}'}]}}),
+            {"success": True}
+        )
+        self.assertEqual(
+            parse({"result": {"file_path": "Test.java", "content": "class Test { }"}}),
+            {"file_path": "Test.java", "content": "class Test { }"}
+        )
+        with self.assertRaises(Exception):
+            parse({"error": {"code": -32603, "message": "Internal error"}})
+
 
 def run_tests():
     """Run all tests."""